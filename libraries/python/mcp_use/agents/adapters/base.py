@@ -79,19 +79,22 @@ class BaseAdapter(Generic[T], ABC):
         Returns:
             The fixed JSON schema.
         """
-        if isinstance(schema, dict):
-            if "type" in schema and isinstance(schema["type"], list):
-                schema["anyOf"] = [{"type": t} for t in schema["type"]]
-                del schema["type"]  # Remove 'type' and standardize to 'anyOf'
-
-            # Fix enum handling - ensure enum fields are properly typed as strings
-            if "enum" in schema and "type" not in schema:
-                schema["type"] = "string"
-
-            for key, value in schema.items():
-                schema[key] = self.fix_schema(value)  # Apply recursively
-        elif isinstance(schema, list):
-            return [self.fix_schema(item) for item in schema]
+        # Walk the schema with an explicit stack instead of recursion; nodes are fixed in place
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if "type" in node and isinstance(node["type"], list):
+                    node["anyOf"] = [{"type": t} for t in node["type"]]
+                    del node["type"]  # Remove 'type' and standardize to 'anyOf'
+
+                # Fix enum handling - ensure enum fields are properly typed as strings
+                if "enum" in node and "type" not in node:
+                    node["type"] = "string"
+
+                stack.extend(value for value in node.values() if isinstance(value, dict | list))
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, dict | list))
         return schema
 
     async def _get_connectors(self, client: MCPClient) -> list[BaseConnector]:
@@ -1,6 +1,7 @@
 import asyncio
-import math
 import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import ClassVar
 
 from langchain_core.tools import BaseTool
@@ -9,6 +10,12 @@ from pydantic import BaseModel, Field
 from mcp_use.agents.managers.tools.base_tool import MCPServerTool
 from mcp_use.logging import logger
 
+# numpy ships with fastembed (optional dependency install with [search])
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class ToolSearchInput(BaseModel):
     """Input for searching for tools across MCP servers"""
@@ -61,6 +68,8 @@ class ToolSearchEngine:
     Uses vector similarity for semantic search with optional result caching.
     """
 
+    QUERY_CACHE_SIZE: ClassVar[int] = 64  # Maximum number of cached query results
+
     def __init__(self, server_manager=None, use_caching: bool = True):
         """
         Initialize the tool search engine.
@@ -82,7 +91,11 @@ class ToolSearchEngine:
         self.tools_by_name = {}  # Maps tool name to tool instance
         self.server_by_tool = {}  # Maps tool name to server name
         self.tool_texts = {}  # Maps tool name to searchable text
-        self.query_cache = {}  # Caches search results by query
+        self.query_cache: OrderedDict[str, list] = OrderedDict()  # LRU cache of search results by query
+
+        # L2-normalized embedding matrix built lazily from tool_embeddings on first search
+        self._embedding_matrix = None
+        self._embedding_names: list[str] = []
 
     def _load_model(self) -> bool:
         """Load the embedding model for semantic search if not already loaded."""
@@ -136,12 +149,21 @@ class ToolSearchEngine:
         Args:
             server_tools: dictionary mapping server names to their tools
         """
+        # Keep embeddings from the previous index so unchanged tools are not re-embedded
+        previous_embeddings = {
+            self.tool_texts[name]: embedding
+            for name, embedding in self.tool_embeddings.items()
+            if name in self.tool_texts
+        }
+
         # Clear previous indexes
         self.tool_embeddings = {}
+        self._embedding_matrix = None
+        self._embedding_names = []
         self.tools_by_name = {}
         self.server_by_tool = {}
         self.tool_texts = {}
-        self.query_cache = {}
+        self.query_cache = OrderedDict()
         self.is_indexed = False
 
         # Collect all tools and their descriptions
@@ -158,14 +180,25 @@ class ToolSearchEngine:
         if not self.tool_texts:
             return
 
-        # Generate embeddings
+        # Reuse embeddings for tools whose text did not change
+        missing_names = []
+        for name, text in self.tool_texts.items():
+            if text in previous_embeddings:
+                self.tool_embeddings[name] = previous_embeddings[text]
+            else:
+                missing_names.append(name)
+
+        if not missing_names:
+            self.is_indexed = True
+            return
+
+        # Generate embeddings for new or changed tools only
         if self._load_model():
-            tool_names = list(self.tool_texts.keys())
-            tool_texts = [self.tool_texts[name] for name in tool_names]
+            tool_texts = [self.tool_texts[name] for name in missing_names]
 
             try:
                 embeddings = self.embedding_function(tool_texts)
-                for name, embedding in zip(tool_names, embeddings, strict=True):
+                for name, embedding in zip(missing_names, embeddings, strict=True):
                     self.tool_embeddings[name] = embedding
 
                 # Mark as indexed if we successfully embedded tools
@@ -190,6 +223,7 @@ class ToolSearchEngine:
         # Check cache first
         cache_key = f"semantic:{query}:{top_k}"
         if self.use_caching and cache_key in self.query_cache:
+            self.query_cache.move_to_end(cache_key)
             return self.query_cache[cache_key]
 
         # Ensure model and embeddings exist
@@ -202,19 +236,31 @@ class ToolSearchEngine:
         except Exception:
             return []
 
-        # Calculate similarity scores
-        scores = {}
-        for tool_name, embedding in self.tool_embeddings.items():
-            # Calculate cosine similarity using pure Python
-            similarity = self._cosine_similarity(query_embedding, embedding)
-            scores[tool_name] = float(similarity)
+        # Calculate cosine similarity scores for all tools with a single matrix-vector product
+        # against the cached, pre-normalized embedding matrix
+        if self._embedding_matrix is None:
+            self._embedding_names = list(self.tool_embeddings)
+            self._embedding_matrix = self._normalize_rows(
+                [self.tool_embeddings[name] for name in self._embedding_names]
+            )
+        tool_names = self._embedding_names
+        scores = self._embedding_matrix @ self._normalize_rows([query_embedding])[0]
 
-        # Sort by score and get top_k results
-        sorted_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        # Select the top_k results without sorting every score; when every tool is
+        # requested there is nothing to partition and a single sort suffices
+        k = min(top_k, len(tool_names))
+        if k <= 0:
+            return []
+        if k < len(tool_names):
+            top_indices = np.argpartition(scores, -k)[-k:]
+            top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
+        else:
+            top_indices = np.argsort(-scores, kind="stable")
 
         # Format results
         results = []
-        for tool_name, score in sorted_results:
+        for index in top_indices:
+            tool_name, score = tool_names[index], float(scores[index])
             tool = self.tools_by_name.get(tool_name)
             server_name = self.server_by_tool.get(tool_name)
             if tool and server_name:
@@ -223,6 +269,8 @@ class ToolSearchEngine:
         # Cache results
         if self.use_caching:
             self.query_cache[cache_key] = results
+            if len(self.query_cache) > self.QUERY_CACHE_SIZE:
+                self.query_cache.popitem(last=False)
 
         return results
 
@@ -303,26 +351,17 @@ class ToolSearchEngine:
 
         return formatted_output
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine similarity between two vectors.
+    def _normalize_rows(self, vectors: Sequence[Sequence[float]]) -> "np.ndarray":
+        """Stack vectors into a float32 matrix with L2-normalized rows.
+
+        Dot products between normalized rows are cosine similarities. Zero vectors
+        stay zero, so they score 0.0 against any query.
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            vectors: Vectors to stack and normalize
 
         Returns:
-            Cosine similarity between the vectors
+            Matrix of shape (len(vectors), dim)
         """
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=False))
-
-        # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
-
-        # Avoid division by zero
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        # Calculate cosine similarity
-        return dot_product / (magnitude1 * magnitude2)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        return matrix / np.clip(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12, None)
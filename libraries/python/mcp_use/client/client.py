@@ -16,6 +16,7 @@ from mcp_use.client.config import create_connector_from_config, load_config_file
 from mcp_use.client.connectors.sandbox import SandboxOptions
 from mcp_use.client.middleware import Middleware, default_logging_middleware
 from mcp_use.client.session import MCPSession
+from mcp_use.client.tool_search import search_sessions_tools
 from mcp_use.logging import logger
 from mcp_use.telemetry.telemetry import Telemetry, telemetry
 
@@ -208,6 +209,10 @@ class MCPClient:
 
         self.config["mcpServers"][name] = server_config
 
+        # Let the code executor connect the new server on its next run
+        if self._code_executor is not None:
+            self._code_executor.invalidate_connections()
+
     @telemetry("client_remove_server")
     def remove_server(self, name: str) -> None:
         """Remove a server configuration.
@@ -222,6 +227,9 @@ class MCPClient:
             if name in self.active_sessions:
                 self.active_sessions.remove(name)
 
+            if self._code_executor is not None:
+                self._code_executor.invalidate_connections()
+
     def add_middleware(self, middleware: Middleware) -> None:
         """Add a middleware.
 
@@ -436,6 +444,10 @@ class MCPClient:
             if server_name in self.active_sessions:
                 self.active_sessions.remove(server_name)
 
+            # Let the code executor reconnect lazily on its next run
+            if self._code_executor is not None:
+                self._code_executor.invalidate_connections()
+
     async def close_all_sessions(self) -> None:
         """Close all active sessions.
 
@@ -546,60 +558,4 @@ class MCPClient:
                 logger.debug("Connecting to configured servers for tool search...")
                 await self.create_all_sessions()
 
-        all_tools = []
-        all_namespaces = set()
-        query_lower = query.lower()
-
-        # First pass: collect all tools and namespaces
-        for server_name, session in self.sessions.items():
-            try:
-                tools = await session.list_tools()
-                if tools:
-                    all_namespaces.add(server_name)
-
-                for tool in tools:
-                    # Build tool info based on detail level (before filtering)
-                    if detail_level == "names":
-                        tool_info = {
-                            "name": tool.name,
-                            "server": server_name,
-                        }
-                    elif detail_level == "descriptions":
-                        tool_info = {
-                            "name": tool.name,
-                            "server": server_name,
-                            "description": getattr(tool, "description", ""),
-                        }
-                    else:  # full
-                        tool_info = {
-                            "name": tool.name,
-                            "server": server_name,
-                            "description": getattr(tool, "description", ""),
-                            "input_schema": getattr(tool, "inputSchema", {}),
-                        }
-
-                    all_tools.append(tool_info)
-
-            except Exception as e:
-                logger.error(f"Failed to list tools for server {server_name}: {e}")
-
-        # Filter by query if provided
-        filtered_tools = all_tools
-        if query:
-            filtered_tools = []
-            for tool_info in all_tools:
-                tool_name_match = query_lower in tool_info["name"].lower()
-                desc_match = query_lower in tool_info.get("description", "").lower()
-                server_match = query_lower in tool_info["server"].lower()
-                if tool_name_match or desc_match or server_match:
-                    filtered_tools.append(tool_info)
-
-        # Return metadata along with results
-        return {
-            "meta": {
-                "total_tools": len(all_tools),
-                "namespaces": sorted(list(all_namespaces)),
-                "result_count": len(filtered_tools),
-            },
-            "results": filtered_tools,
-        }
+        return await search_sessions_tools(self.sessions, query, detail_level)
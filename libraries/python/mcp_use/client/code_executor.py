@@ -7,17 +7,90 @@ direct tool calls.
 """
 
 import asyncio
-import io
+import json
 import re
+import sys
+import threading
 import time
-from contextlib import redirect_stderr, redirect_stdout
-from typing import TYPE_CHECKING, Any
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TextIO
 
+from mcp_use.client.tool_search import search_sessions_tools
 from mcp_use.logging import logger
 
 if TYPE_CHECKING:
     from mcp_use.client.client import MCPClient
 
+# First characters a JSON document can start with (json.loads also accepts NaN/Infinity)
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+# Per-task buffers for stdout/stderr written while agent code is executing
+_stdout_capture: ContextVar[list[str] | None] = ContextVar("code_executor_stdout", default=None)
+_stderr_capture: ContextVar[list[str] | None] = ContextVar("code_executor_stderr", default=None)
+
+
+class _ContextCaptureStream:
+    """Stream proxy that routes writes to the current task's capture buffer.
+
+    Unlike contextlib.redirect_stdout, which swaps sys.stdout process-wide for the
+    duration of an await, this lets concurrent executions capture their own output
+    while writes from anywhere else still reach the wrapped stream.
+    """
+
+    def __init__(self, stream: TextIO, capture: ContextVar[list[str] | None]):
+        self._stream = stream
+        self._capture = capture
+
+    def write(self, text: str) -> int:
+        buffer = self._capture.get()
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if self._capture.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+# Number of executions in flight, and the proxies installed for them
+_capture_lock = threading.Lock()
+_capture_count = 0
+_capture_proxies: tuple[_ContextCaptureStream, _ContextCaptureStream] | None = None
+
+
+def _install_capture_streams() -> None:
+    """Wrap sys.stdout/sys.stderr with capture proxies for the first execution in flight."""
+    global _capture_count, _capture_proxies
+    with _capture_lock:
+        if _capture_count == 0:
+            _capture_proxies = (
+                _ContextCaptureStream(sys.stdout, _stdout_capture),
+                _ContextCaptureStream(sys.stderr, _stderr_capture),
+            )
+            sys.stdout, sys.stderr = _capture_proxies
+        _capture_count += 1
+
+
+def _restore_capture_streams() -> None:
+    """Put back the original streams once the last execution in flight finishes."""
+    global _capture_count, _capture_proxies
+    with _capture_lock:
+        _capture_count -= 1
+        if _capture_count > 0 or _capture_proxies is None:
+            return
+        stdout_proxy, stderr_proxy = _capture_proxies
+        _capture_proxies = None
+        # Leave streams alone if something else replaced our proxies in the meantime
+        if sys.stdout is stdout_proxy:
+            sys.stdout = stdout_proxy._stream
+        if sys.stderr is stderr_proxy:
+            sys.stderr = stderr_proxy._stream
+
 
 class CodeExecutor:
     """Executes Python code with access to MCP tools in a restricted namespace.
@@ -34,6 +107,14 @@ class CodeExecutor:
         """
         self.client = client
         self._tool_cache: dict[str, dict[str, Any]] = {}
+        self._all_connected = False
+
+    def invalidate_connections(self) -> None:
+        """Force the next execution to re-check that all configured servers are connected.
+
+        Called by the client whenever a server is added or removed, or a session is closed.
+        """
+        self._all_connected = False
 
     async def execute(self, code: str, timeout: float = 30.0) -> dict[str, Any]:
         """Execute Python code with access to MCP tools.
@@ -50,56 +131,60 @@ class CodeExecutor:
                 - execution_time: Time taken to execute in seconds
         """
         # Ensure all servers are connected (lazy connection)
-        # We check client.sessions directly to see internal state
-        configured_servers = set(self.client.get_server_names())
-        active_sessions = set(self.client.sessions.keys())
-
-        # If any configured server is missing from sessions, trigger connection
-        if not configured_servers.issubset(active_sessions):
-            logger.debug("Connecting to configured servers for code execution...")
-            await self.client.create_all_sessions()
+        # We check client.sessions directly to see internal state, but only until
+        # the first successful connection; adding, removing or closing a server resets the flag.
+        if not self._all_connected:
+            if not set(self.client.get_server_names()).issubset(self.client.sessions.keys()):
+                logger.debug("Connecting to configured servers for code execution...")
+                await self.client.create_all_sessions()
+            self._all_connected = True
 
         start_time = time.time()
         logs: list[str] = []
         result = None
         error = None
 
-        # Capture stdout/stderr
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+        # Capture stdout/stderr for this task only
+        stdout_chunks: list[str] = []
+        stderr_chunks: list[str] = []
+        _install_capture_streams()
+        stdout_token = _stdout_capture.set(stdout_chunks)
+        stderr_token = _stderr_capture.set(stderr_chunks)
 
         try:
             # Build execution namespace
             namespace = await self._build_namespace()
 
             # Add print capture function
-            def captured_print(*args, **kwargs):
-                output = io.StringIO()
-                print(*args, file=output, **kwargs)
-                log_message = output.getvalue().rstrip("\n")
-                logs.append(log_message)
+            def captured_print(*args, sep=" ", end="\n", **_):
+                logs.append((" " if sep is None else sep).join(map(str, args)))
 
             namespace["print"] = captured_print
 
             # Execute code with timeout
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                try:
-                    result = await asyncio.wait_for(self._execute_code(code, namespace), timeout=timeout)
-                except TimeoutError:
-                    error = f"Execution timeout after {timeout} seconds"
-                    logger.warning(f"Code execution timeout: {timeout}s")
+            try:
+                # asyncio.timeout() runs the code in the current task instead of wrapping it in a new one
+                async with asyncio.timeout(timeout):
+                    result = await self._execute_code(code, namespace)
+            except TimeoutError:
+                error = f"Execution timeout after {timeout} seconds"
+                logger.warning(f"Code execution timeout: {timeout}s")
 
         except Exception as e:
             error = str(e)
             logger.error(f"Code execution error: {e}")
+        finally:
+            _stdout_capture.reset(stdout_token)
+            _stderr_capture.reset(stderr_token)
+            _restore_capture_streams()
 
         execution_time = time.time() - start_time
 
         # Capture any stdout/stderr that wasn't captured by our print wrapper
-        if stdout_capture.getvalue():
-            logs.extend(stdout_capture.getvalue().strip().split("\n"))
-        if stderr_capture.getvalue():
-            logs.extend([f"[ERROR] {line}" for line in stderr_capture.getvalue().strip().split("\n")])
+        if stdout_chunks:
+            logs.extend("".join(stdout_chunks).splitlines())
+        if stderr_chunks:
+            logs.extend([f"[ERROR] {line}" for line in "".join(stderr_chunks).splitlines()])
 
         return {"result": result, "logs": logs, "error": error, "execution_time": execution_time}
 
@@ -197,7 +282,7 @@ class CodeExecutor:
                     continue
 
                 # Create namespace object for this server
-                server_namespace = type(server_name, (), {})()
+                server_namespace = SimpleNamespace()
 
                 for tool in tools:
                     tool_name = tool.name
@@ -239,12 +324,12 @@ class CodeExecutor:
         Returns:
             Async function that calls the MCP tool.
         """
+        # Bind the session lookup once so each tool call skips the attribute chain
+        _get_session = self.client.get_session
 
         async def tool_wrapper(**kwargs):
             """Dynamically generated tool wrapper."""
-            import json
-
-            session = self.client.get_session(server_name)
+            session = _get_session(server_name)
             result = await session.call_tool(tool_name, kwargs)
 
             # Extract content from result
@@ -254,7 +339,11 @@ class CodeExecutor:
                     content_item = result.content[0]
                     if hasattr(content_item, "text"):
                         text = content_item.text
-                        # Try to parse as JSON if possible
+                        # Only attempt JSON parsing when the text can start a JSON value,
+                        # so plain prose results skip the exception path entirely
+                        stripped = text.lstrip()
+                        if not stripped or stripped[0] not in _JSON_START_CHARS:
+                            return text
                         try:
                             return json.loads(text)
                         except (json.JSONDecodeError, ValueError):
@@ -291,62 +380,6 @@ class CodeExecutor:
                 - meta: Dictionary containing total_tools, namespaces, and result_count
                 - results: List of tool information dictionaries matching the query
             """
-            all_tools = []
-            all_namespaces = set()
-            query_lower = query.lower()
-
-            # First pass: collect all tools and namespaces
-            for server_name, session in self.client.sessions.items():
-                try:
-                    tools = await session.list_tools()
-                    if tools:
-                        all_namespaces.add(server_name)
-
-                    for tool in tools:
-                        # Build tool info based on detail level (before filtering)
-                        if detail_level == "names":
-                            tool_info = {
-                                "name": tool.name,
-                                "server": server_name,
-                            }
-                        elif detail_level == "descriptions":
-                            tool_info = {
-                                "name": tool.name,
-                                "server": server_name,
-                                "description": getattr(tool, "description", ""),
-                            }
-                        else:  # full
-                            tool_info = {
-                                "name": tool.name,
-                                "server": server_name,
-                                "description": getattr(tool, "description", ""),
-                                "input_schema": getattr(tool, "inputSchema", {}),
-                            }
-
-                        all_tools.append(tool_info)
-
-                except Exception as e:
-                    logger.error(f"Failed to list tools for server {server_name}: {e}")
-
-            # Filter by query if provided
-            filtered_tools = all_tools
-            if query:
-                filtered_tools = []
-                for tool_info in all_tools:
-                    tool_name_match = query_lower in tool_info["name"].lower()
-                    desc_match = query_lower in tool_info.get("description", "").lower()
-                    server_match = query_lower in tool_info["server"].lower()
-                    if tool_name_match or desc_match or server_match:
-                        filtered_tools.append(tool_info)
-
-            # Return metadata along with results
-            return {
-                "meta": {
-                    "total_tools": len(all_tools),
-                    "namespaces": sorted(list(all_namespaces)),
-                    "result_count": len(filtered_tools),
-                },
-                "results": filtered_tools,
-            }
+            return await search_sessions_tools(self.client.sessions, query, detail_level)
 
         return search_tools
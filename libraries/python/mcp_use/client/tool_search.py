@@ -0,0 +1,102 @@
+"""
+Tool search shared by MCP clients and code execution.
+
+This module provides the search used by MCPClient.search_tools and by the
+search_tools function available inside executed code.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from mcp_use.logging import logger
+
+if TYPE_CHECKING:
+    from mcp_use.client.session import MCPSession
+
+
+def _tool_names_info(tool: Any, server_name: str) -> dict[str, Any]:
+    return {"name": tool.name, "server": server_name}
+
+
+def _tool_descriptions_info(tool: Any, server_name: str) -> dict[str, Any]:
+    return {
+        "name": tool.name,
+        "server": server_name,
+        "description": getattr(tool, "description", ""),
+    }
+
+
+def _full_tool_info(tool: Any, server_name: str) -> dict[str, Any]:
+    return {
+        "name": tool.name,
+        "server": server_name,
+        "description": getattr(tool, "description", ""),
+        "input_schema": getattr(tool, "inputSchema", {}),
+    }
+
+
+# Tool info builders per search_tools detail level, resolved once per search
+_TOOL_INFO_BUILDERS = {
+    "names": _tool_names_info,
+    "descriptions": _tool_descriptions_info,
+    "full": _full_tool_info,
+}
+
+
+async def search_sessions_tools(
+    sessions: "dict[str, MCPSession]", query: str = "", detail_level: str = "full"
+) -> dict[str, Any]:
+    """Search the tools exposed by a set of sessions.
+
+    Shared by MCPClient.search_tools and the search_tools function available
+    inside executed code.
+
+    Args:
+        sessions: Mapping of server names to their sessions.
+        query: Search query to filter tools by name, description or server.
+        detail_level: Level of detail to return ("names", "descriptions", "full").
+
+    Returns:
+        Dictionary with:
+        - meta: Dictionary containing total_tools, namespaces, and result_count
+        - results: List of tool information dictionaries matching the query
+    """
+    all_tools = []
+    all_namespaces = set()
+    query_lower = query.lower()
+    # Build tool info based on detail level (before filtering); "full" is the fallback
+    build_tool_info = _TOOL_INFO_BUILDERS.get(detail_level, _full_tool_info)
+
+    # First pass: collect all tools and namespaces
+    for server_name, session in sessions.items():
+        try:
+            tools = await session.list_tools()
+            if tools:
+                all_namespaces.add(server_name)
+
+            all_tools.extend(build_tool_info(tool, server_name) for tool in tools)
+
+        except Exception as e:
+            logger.error(f"Failed to list tools for server {server_name}: {e}")
+
+    # Filter by query if provided. Server names are lowercased once per server
+    # rather than per tool, and a name hit skips the description check.
+    filtered_tools = all_tools
+    if query:
+        server_matches = {name: query_lower in name.lower() for name in all_namespaces}
+        filtered_tools = [
+            tool_info
+            for tool_info in all_tools
+            if server_matches[tool_info["server"]]
+            or query_lower in tool_info["name"].lower()
+            or query_lower in (tool_info.get("description") or "").lower()
+        ]
+
+    # Return metadata along with results
+    return {
+        "meta": {
+            "total_tools": len(all_tools),
+            "namespaces": sorted(list(all_namespaces)),
+            "result_count": len(filtered_tools),
+        },
+        "results": filtered_tools,
+    }
@@ -1,14 +1,7 @@
 # mcp_use/config.py
 import warnings
-
-from typing_extensions import deprecated
-
-from mcp_use.client.config import (
-    create_connector_from_config as _create_connector_from_config,
-)
-from mcp_use.client.config import (
-    load_config_file as _load_config_file,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 warnings.warn(
     "mcp_use.config is deprecated. Use mcp_use.client.config. This import will be removed in version 2.0.0",
@@ -16,12 +9,19 @@ warnings.warn(
     stacklevel=2,
 )
 
+if TYPE_CHECKING:
+    from mcp_use.client.config import create_connector_from_config, load_config_file
+
+__all__ = ["load_config_file", "create_connector_from_config"]
 
-@deprecated("Use mcp_use.client.config.load_config_file")
-def load_config_file(*args, **kwargs):
-    return _load_config_file(*args, **kwargs)
+_warned: set[str] = set()
 
 
-@deprecated("Use mcp_use.client.config.create_connector_from_config")
-def create_connector_from_config(*args, **kwargs):
-    return _create_connector_from_config(*args, **kwargs)
+def __getattr__(name: str) -> Any:
+    # Resolve deprecated names lazily (PEP 562), warning once per name
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in _warned:
+        _warned.add(name)
+        warnings.warn(f"Use mcp_use.client.config.{name}", DeprecationWarning, stacklevel=2)
+    return getattr(import_module("mcp_use.client.config"), name)
@@ -1,23 +1,7 @@
 # mcp_use/connectors/__init__.py
 import warnings
-
-from typing_extensions import deprecated
-
-from mcp_use.client.connectors import (
-    BaseConnector as _BaseConnector,
-)
-from mcp_use.client.connectors import (
-    HttpConnector as _HttpConnector,
-)
-from mcp_use.client.connectors import (
-    SandboxConnector as _SandboxConnector,
-)
-from mcp_use.client.connectors import (
-    StdioConnector as _StdioConnector,
-)
-from mcp_use.client.connectors import (
-    WebSocketConnector as _WebSocketConnector,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 warnings.warn(
     "mcp_use.connectors is deprecated. Use mcp_use.client.connectors. This import will be removed in version 2.0.0",
@@ -25,22 +9,25 @@ warnings.warn(
     stacklevel=2,
 )
 
+if TYPE_CHECKING:
+    from mcp_use.client.connectors import (
+        BaseConnector,
+        HttpConnector,
+        SandboxConnector,
+        StdioConnector,
+        WebSocketConnector,
+    )
 
-@deprecated("Use mcp_use.client.connectors.BaseConnector")
-class BaseConnector(_BaseConnector): ...
-
-
-@deprecated("Use mcp_use.client.connectors.StdioConnector")
-class StdioConnector(_StdioConnector): ...
-
-
-@deprecated("Use mcp_use.client.connectors.HttpConnector")
-class HttpConnector(_HttpConnector): ...
-
+__all__ = ["BaseConnector", "StdioConnector", "HttpConnector", "WebSocketConnector", "SandboxConnector"]
 
-@deprecated("Use mcp_use.client.connectors.WebSocketConnector")
-class WebSocketConnector(_WebSocketConnector): ...
+_warned: set[str] = set()
 
 
-@deprecated("Use mcp_use.client.connectors.SandboxConnector")
-class SandboxConnector(_SandboxConnector): ...
+def __getattr__(name: str) -> Any:
+    # Resolve deprecated names lazily (PEP 562), warning once per name
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in _warned:
+        _warned.add(name)
+        warnings.warn(f"Use mcp_use.client.connectors.{name}", DeprecationWarning, stacklevel=2)
+    return getattr(import_module("mcp_use.client.connectors"), name)
@@ -1,20 +1,7 @@
 # mcp_use/middleware/metrics.py
 import warnings
-
-from typing_extensions import deprecated
-
-from mcp_use.client.middleware.metrics import (
-    CombinedAnalyticsMiddleware as _CombinedAnalyticsMiddleware,
-)
-from mcp_use.client.middleware.metrics import (
-    ErrorTrackingMiddleware as _ErrorTrackingMiddleware,
-)
-from mcp_use.client.middleware.metrics import (
-    MetricsMiddleware as _MetricsMiddleware,
-)
-from mcp_use.client.middleware.metrics import (
-    PerformanceMetricsMiddleware as _PerformanceMetricsMiddleware,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 warnings.warn(
     "mcp_use.middleware.metrics is deprecated. "
@@ -24,18 +11,29 @@ warnings.warn(
     stacklevel=2,
 )
 
-
-@deprecated("Use mcp_use.client.middleware.metrics.CombinedAnalyticsMiddleware")
-class CombinedAnalyticsMiddleware(_CombinedAnalyticsMiddleware): ...
-
-
-@deprecated("Use mcp_use.client.middleware.metrics.ErrorTrackingMiddleware")
-class ErrorTrackingMiddleware(_ErrorTrackingMiddleware): ...
-
-
-@deprecated("Use mcp_use.client.middleware.metrics.MetricsMiddleware")
-class MetricsMiddleware(_MetricsMiddleware): ...
-
-
-@deprecated("Use mcp_use.client.middleware.metrics.PerformanceMetricsMiddleware")
-class PerformanceMetricsMiddleware(_PerformanceMetricsMiddleware): ...
+if TYPE_CHECKING:
+    from mcp_use.client.middleware.metrics import (
+        CombinedAnalyticsMiddleware,
+        ErrorTrackingMiddleware,
+        MetricsMiddleware,
+        PerformanceMetricsMiddleware,
+    )
+
+__all__ = [
+    "CombinedAnalyticsMiddleware",
+    "ErrorTrackingMiddleware",
+    "MetricsMiddleware",
+    "PerformanceMetricsMiddleware",
+]
+
+_warned: set[str] = set()
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve deprecated names lazily (PEP 562), warning once per name
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in _warned:
+        _warned.add(name)
+        warnings.warn(f"Use mcp_use.client.middleware.metrics.{name}", DeprecationWarning, stacklevel=2)
+    return getattr(import_module("mcp_use.client.middleware.metrics"), name)
@@ -2,8 +2,9 @@
 
 from mcp_use.server.logging.config import setup_logging
 from mcp_use.server.logging.formatters import ColoredFormatter, MCPAccessFormatter, MCPErrorFormatter
+from mcp_use.server.logging.handlers import QueuedStreamHandler
 from mcp_use.server.logging.middleware import MCPLoggingMiddleware
-from mcp_use.server.logging.state import get_method_info, set_method_info
+from mcp_use.server.logging.state import get_method_info, reset_method_info, set_method_info
 
 
 def get_logging_config(
@@ -31,17 +32,23 @@ def get_logging_config(
     )
 
 
-# Legacy constant for backward compatibility
-MCP_LOGGING_CONFIG = get_logging_config()
+def __getattr__(name: str):
+    # Legacy MCP_LOGGING_CONFIG constant, built on first access rather than at import
+    if name == "MCP_LOGGING_CONFIG":
+        return get_logging_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "MCPLoggingMiddleware",
     "get_logging_config",
     "get_method_info",
+    "reset_method_info",
     "set_method_info",
     "setup_logging",
     "ColoredFormatter",
     "MCPAccessFormatter",
     "MCPErrorFormatter",
+    "QueuedStreamHandler",
     "MCP_LOGGING_CONFIG",
 ]
@@ -4,6 +4,15 @@ import logging
 
 from mcp_use.server.logging.formatters import ColoredFormatter, MCPAccessFormatter, MCPErrorFormatter
 
+# Noisy loggers routed to a null handler, with the level they are capped at
+SUPPRESSED_LOGGERS = {
+    "mcp.server.lowlevel.server": "CRITICAL",
+    "mcp.server.streamable_http_manager": "CRITICAL",
+    "mcp.server.fastmcp": "CRITICAL",
+    "mcp": "CRITICAL",
+    "httpx": "WARNING",
+}
+
 
 class InspectorLogFilter(logging.Filter):
     """Filter that hides inspector-related access logs."""
@@ -25,9 +34,9 @@ class InspectorLogFilter(logging.Filter):
 class MCPLogsOnlyFilter(logging.Filter):
     """Filter that drops all uvicorn access log records.
 
-    MCP protocol logs are printed directly to stdout by MCPLoggingMiddleware,
-    bypassing the logging system entirely. This filter drops all uvicorn access
-    records so only the MCP: lines remain.
+    MCP protocol lines from MCPLoggingMiddleware are logged without uvicorn's args
+    tuple, so they pass through. This filter drops all uvicorn access records so
+    only the MCP: lines remain.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
@@ -52,36 +61,25 @@ def setup_logging(
         show_inspector_logs: Whether to show inspector-related access logs (default: False)
         inspector_path: Effective inspector route prefix, typically `/inspector`
             or a prefixed route like `/mcp/inspector`
-        mcp_logs_only: When True, suppress all uvicorn access logs (MCP logs are printed
-            directly by the middleware). Default: False.
+        mcp_logs_only: When True, suppress all uvicorn access logs (MCP logs from the
+            middleware are kept). Default: False.
 
     Returns:
         Uvicorn logging configuration dict
     """
 
-    # Suppress noisy loggers
-    suppressed_loggers = {
-        "uvicorn.error": "ERROR",
-        "mcp.server.lowlevel.server": "CRITICAL",
-        "mcp.server.streamable_http_manager": "CRITICAL",
-        "mcp.server.fastmcp": "CRITICAL",
-        "mcp": "CRITICAL",
-        "httpx": "WARNING",
-    }
-
     # Configure loggers
     loggers = {
         # Access logs with MCP enhancement (handled by middleware)
         "uvicorn.access": {"handlers": ["access"], "level": log_level, "propagate": False},
+        # MCP protocol lines from MCPLoggingMiddleware share the queued access handler
+        "mcp.access": {"handlers": ["access"], "level": "INFO", "propagate": False},
         # Error logs with custom formatting
         "uvicorn.error": {"handlers": ["error"], "level": "ERROR", "propagate": False},
-        # Suppress noisy loggers
-        **{
-            logger_name: {"handlers": ["null"], "level": level, "propagate": False}
-            for logger_name, level in suppressed_loggers.items()
-            if logger_name != "uvicorn.error"
-        },
     }
+    # Suppress noisy loggers
+    for logger_name, level in SUPPRESSED_LOGGERS.items():
+        loggers[logger_name] = {"handlers": ["null"], "level": level, "propagate": False}
 
     # Add debug logger if debug mode is enabled
     if debug_level >= 2:
@@ -102,7 +100,7 @@ def setup_logging(
         access_filters.append("mcp_logs_only_filter")
     access_handler = {
         "formatter": "access",
-        "class": "logging.StreamHandler",
+        "class": "mcp_use.server.logging.handlers.QueuedStreamHandler",
         "stream": "ext://sys.stdout",
     }
     if access_filters:
@@ -136,7 +134,10 @@ def setup_logging(
             },
             "debug": {
                 "formatter": "colored" if debug_level >= 2 else "debug",
-                "class": "logging.StreamHandler",
+                # Only start a writer thread when the debug logger is actually in use
+                "class": "mcp_use.server.logging.handlers.QueuedStreamHandler"
+                if debug_level >= 2
+                else "logging.StreamHandler",
                 "stream": "ext://sys.stdout",
             },
             "null": {
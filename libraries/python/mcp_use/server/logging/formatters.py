@@ -17,6 +17,25 @@ YELLOW = "\033[33m"
 CYAN = "\033[36m"
 MAGENTA = "\033[35m"
 
+# Precomposed colored level prefixes for access log lines
+_LEVEL_PREFIXES = {
+    "INFO": f"{GREEN}INFO:{RESET} ",
+    "ERROR": f"{RED}ERROR:{RESET} ",
+    "WARNING": f"{YELLOW}WARNING:{RESET} ",
+    "DEBUG": f"{CYAN}DEBUG:{RESET} ",
+}
+
+# HTTP methods padded to 4 characters so access log paths line up
+_PADDED_METHODS = {m: m.ljust(4) for m in ("GET", "POST", "PUT", "HEAD", "DELETE", "OPTIONS", "PATCH")}
+
+# Matches the "('host', port)" address in uvicorn bind errors
+_BIND_ADDRESS_RE = re.compile(r"'([^']+)', (\d+)")
+
+
+def pad_http_method(method: str) -> str:
+    """Left-align an HTTP method to 4 characters for visual alignment."""
+    return _PADDED_METHODS.get(method) or method.ljust(4)
+
 
 @dataclass
 class UvicornAccessArgs:
@@ -82,7 +101,7 @@ class MCPAccessFormatter(AccessFormatter):
     """
     Enhanced Uvicorn access formatter that shows MCP method information.
 
-    For MCP requests, enhances the log with JSON-RPC method info from thread-local storage.
+    For MCP requests, enhances the log with JSON-RPC method info from per-request context storage.
     """
 
     def __init__(self, **kwargs):
@@ -101,7 +120,7 @@ class MCPAccessFormatter(AccessFormatter):
             return record.getMessage()
 
         # Pad HTTP method for visual alignment (GET, POST, PUT, etc.)
-        padded_method = f"{access_args.method:<4}"
+        padded_method = pad_http_method(access_args.method)
 
         # Enhance MCP requests with JSON-RPC method info
         final_path = access_args.path
@@ -121,11 +140,10 @@ class MCPAccessFormatter(AccessFormatter):
 
     def _add_level_prefix(self, levelname: str, message: str) -> str:
         """Add colored level prefix to the message."""
-        colors = {"INFO": GREEN, "ERROR": RED, "WARNING": YELLOW, "DEBUG": CYAN}
-        color = colors.get(levelname, "")
-        if color:
-            return f"{color}{levelname}:{RESET} {message}"
-        return f"{levelname}: {message}"
+        prefix = _LEVEL_PREFIXES.get(levelname)
+        if prefix is None:
+            return f"{levelname}: {message}"
+        return prefix + message
 
 
 class MCPErrorFormatter(logging.Formatter):
@@ -136,7 +154,7 @@ class MCPErrorFormatter(logging.Formatter):
 
         # Customize port conflict errors
         if "address already in use" in msg.lower():
-            port_match = re.search(r"'([^']+)', (\d+)", msg)
+            port_match = _BIND_ADDRESS_RE.search(msg)
             if port_match:
                 host, port = port_match.groups()
                 return (
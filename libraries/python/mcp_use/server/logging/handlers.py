@@ -0,0 +1,43 @@
+"""Log handlers for MCP servers."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+
+class QueuedStreamHandler(logging.Handler):
+    """Stream handler that writes records from a background thread.
+
+    Records are formatted (and filtered) on the calling thread, then handed to a
+    ``QueueListener`` so the stream write and flush happen off the request path.
+
+    This wraps a ``QueueHandler`` rather than subclassing it: on Python 3.12+
+    ``logging.config.dictConfig`` treats every ``QueueHandler`` subclass as a queue
+    handler configuration and rejects the ``stream`` argument.
+    """
+
+    def __init__(self, stream: TextIO | None = None):
+        super().__init__()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.stream_handler = logging.StreamHandler(stream)
+        self._queue_handler = QueueHandler(self.queue)
+        self._listener: QueueListener | None = QueueListener(self.queue, self.stream_handler)
+        self._listener.start()
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:
+        super().setFormatter(fmt)
+        # The inner QueueHandler does the formatting before enqueueing
+        self._queue_handler.setFormatter(fmt)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._queue_handler.emit(record)
+
+    def close(self) -> None:
+        """Drain pending records and stop the writer thread."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+        self.stream_handler.close()
+        self._queue_handler.close()
+        super().close()
@@ -1,93 +1,188 @@
 """MCP logging middleware."""
 
 import json
+import logging
+import re
 import time
-from collections.abc import AsyncIterator
-from typing import cast
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from mcp_use.server.logging.state import get_method_info, set_method_info
+from mcp_use.server.logging.formatters import BOLD, CYAN, GREEN, RESET, pad_http_method
+from mcp_use.server.logging.state import get_method_info, reset_method_info, set_method_info
+
+# orjson decodes bytes directly and is much faster on small JSON-RPC bodies; used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_pretty(obj) -> str:
+    """Serialize a JSON value with 2-space indentation for debug output."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# MCP access lines go through the queued access handler when the server's logging
+# config is applied, and are printed directly otherwise
+access_logger = logging.getLogger("mcp.access")
+
+# Line prefixes, padded to align with "INFO: "
+_MCP_ACCESS_PREFIX = f"{GREEN}MCP:{RESET}  "
+_MCP_DEBUG_PREFIX = f"{CYAN}MCP:{RESET}  "
 
 # Rich console for formatted output
 _console = Console()
 CODE_THEME = "nord"
 
 
-class MCPLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware that extracts MCP method information from JSON-RPC requests."""
+# JSON-RPC also allows positional (array) params, so neither extractor assumes a dict
+def _param_name(params) -> str | None:
+    return params.get("name") if isinstance(params, dict) else None
+
+
+def _uri_name(params) -> str | None:
+    uri = params.get("uri") if isinstance(params, dict) else None
+    return uri.rsplit("/", 1)[-1] if isinstance(uri, str) else None
+
+
+# JSON-RPC methods whose log display includes the targeted tool, resource or prompt
+_NAME_EXTRACTORS = {
+    "tools/call": _param_name,
+    "resources/read": _uri_name,
+    "prompts/get": _param_name,
+}
+
+# Byte-level probes for the top-level "method" and "id" members of a JSON-RPC body
+_METHOD_RE = re.compile(rb'"method"\s*:\s*"([^"\\]*)"')
+_ID_RE = re.compile(rb'"id"\s*:\s*(-?\d+|"[^"\\]*")')
+
+
+def _scan_method_info(body_bytes: bytes) -> dict | None:
+    """Extract method info without a full JSON parse when no params are needed.
+
+    The probes only run when the top-level object is the body's only non-empty
+    container, so any "method"/"id" key found must be a top-level member. Anything
+    else (nested params, results, batches, escaped strings) or a method that needs
+    its params returns None, and the caller parses fully.
+    """
+    if body_bytes.count(b"{") - body_bytes.count(b"{}") != 1 or b"[" in body_bytes:
+        return None
+    if body_bytes.count(b'"method"') != 1:
+        return None
+    method_match = _METHOD_RE.search(body_bytes)
+    if method_match is None:
+        return None
+    method = method_match.group(1).decode("utf-8", errors="replace")
+    if method in _NAME_EXTRACTORS:
+        return None
+
+    request_id = None
+    id_count = body_bytes.count(b'"id"')
+    if id_count > 1:
+        return None
+    if id_count == 1:
+        id_match = _ID_RE.search(body_bytes)
+        if id_match is None:
+            return None
+        raw_id = id_match.group(1)
+        request_id = raw_id[1:-1].decode("utf-8", errors="replace") if raw_id[:1] == b'"' else int(raw_id)
+
+    return {"method": method, "name": None, "display": method, "session_id": request_id}
+
+
+def _replay_receive(first: Message, receive: Receive) -> Receive:
+    """Return a receive channel that yields ``first`` once, then defers to ``receive``."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return first
+
+    return replay
 
-    def __init__(self, app, debug_level: int = 0, mcp_path: str = "/mcp", pretty_print_jsonrpc: bool = False):
-        super().__init__(app)
+
+class MCPLoggingMiddleware:
+    """ASGI middleware that extracts MCP method information from JSON-RPC requests."""
+
+    def __init__(self, app: ASGIApp, debug_level: int = 0, mcp_path: str = "/mcp", pretty_print_jsonrpc: bool = False):
+        self.app = app
         self.debug_level = debug_level
         self.mcp_path = mcp_path
         self.pretty_print_jsonrpc = pretty_print_jsonrpc
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only process POST requests to the MCP endpoint
-        if request.method != "POST" or not request.url.path.endswith(self.mcp_path):
-            return await call_next(request)
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].endswith(self.mcp_path):
+            await self.app(scope, receive, send)
+            return
 
         # Read request body
-        body_bytes = await request.body()
+        body_chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Client disconnected mid-body: forward the disconnect rather than a truncated body
+                await self.app(scope, _replay_receive(message, receive), send)
+                return
+            body_chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body_bytes = b"".join(body_chunks)
+
+        # Replay the buffered body to the app, then hand over to the real receive channel
+        replay_receive = _replay_receive({"type": "http.request", "body": body_bytes, "more_body": False}, receive)
 
         # Parse MCP method info
         method_info = self._parse_mcp_method(body_bytes)
+        if not method_info:
+            await self.app(scope, replay_receive, send)
+            return
 
-        # Store method info for access logger
-        if method_info:
-            set_method_info(method_info)
-
-        # Create new request with body
-        async def receive():
-            return {"type": "http.request", "body": body_bytes}
+        # Store method info for access logger, scoped to this request
+        method_info_token = set_method_info(method_info)
 
-        request_with_body = Request(request.scope, receive)
-
-        # Execute request and measure time
-        start_time = time.time()
-        response = await call_next(request_with_body)
-
-        # Capture response body for logging (need to read and reconstruct)
-        # Limit to 1MB to prevent memory issues with large responses
+        # Capture response body for logging, limited to 1MB to prevent memory issues
         max_body_size = 1024 * 1024
-        response_body: bytes | None = None
-        response_too_large = False
-        if self.debug_level >= 2 and method_info:
-            body_iterator = getattr(response, "body_iterator", None)
-            if body_iterator is not None:
-                chunks = []
-                total_size = 0
-                iterator = cast(AsyncIterator[bytes], body_iterator)
-                async for chunk in iterator:
-                    chunks.append(chunk)
-                    total_size += len(chunk)
-                if total_size > max_body_size:
-                    response_too_large = True
-                else:
-                    response_body = b"".join(chunks)
-                # Reconstruct response with captured body
-                response = Response(
-                    content=b"".join(chunks),
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
+        capture_response = self.debug_level >= 2
+        log_debug = self.pretty_print_jsonrpc or capture_response
+        response_chunks: list[bytes] = []
+        response_size = 0
+        start_time = time.perf_counter()
+
+        async def logging_send(message: Message) -> None:
+            nonlocal response_size
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                # Log access info with MCP method stub
+                await self._log_access_info(scope, method_info, message["status"])
+            elif message_type == "http.response.body" and capture_response:
+                chunk = message.get("body", b"")
+                response_size += len(chunk)
+                if response_size <= max_body_size:
+                    response_chunks.append(chunk)
+
+            await send(message)
+
+            # Log debug info once the response is complete
+            if log_debug and message_type == "http.response.body" and not message.get("more_body", False):
+                response_too_large = response_size > max_body_size
+                response_body = b"".join(response_chunks) if capture_response and not response_too_large else None
+                await self._log_debug_info(method_info, body_bytes, response_body, start_time, response_too_large)
 
-        # Log access info with MCP method stub
-        if method_info:
-            await self._log_access_info(request, method_info, response, start_time)
-
-        # Log debug info if pretty_print is enabled OR debug_level >= 2
-        if method_info and (self.pretty_print_jsonrpc or self.debug_level >= 2):
-            await self._log_debug_info(request, method_info, body_bytes, response_body, start_time, response_too_large)
-
-        return response
+        try:
+            await self.app(scope, replay_receive, logging_send)
+        finally:
+            reset_method_info(method_info_token)
 
     def _extract_sse_data(self, text: str) -> str:
         """Extract JSON data from SSE format (event: message\\ndata: {...})."""
@@ -102,8 +197,13 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
         if not body_bytes:
             return None
 
+        # Most requests (lists, pings, notifications) only need the method name
+        method_info = _scan_method_info(body_bytes)
+        if method_info is not None:
+            return method_info
+
         try:
-            body_json = json.loads(body_bytes)
+            body_json = _json_loads(body_bytes)
             method = body_json.get("method", "unknown")
             params = body_json.get("params", {})
 
@@ -111,16 +211,11 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
             name = None
             display = method
 
-            if method == "tools/call" and "name" in params:
-                name = params["name"]
-                display = f"{method}:{name}"
-            elif method == "resources/read" and "uri" in params:
-                uri = params["uri"]
-                name = uri.split("/")[-1] if "/" in uri else uri
-                display = f"{method}:{name}"
-            elif method == "prompts/get" and "name" in params:
-                name = params["name"]
-                display = f"{method}:{name}"
+            extract_name = _NAME_EXTRACTORS.get(method)
+            if extract_name is not None:
+                name = extract_name(params)
+                if name is not None:
+                    display = f"{method}:{name}"
 
             return {"method": method, "name": name, "display": display, "session_id": body_json.get("id")}
         except (json.JSONDecodeError, UnicodeDecodeError):
@@ -128,7 +223,6 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
 
     async def _log_debug_info(
         self,
-        request: Request,
         method_info: dict,
         request_body: bytes,
         response_body: bytes | None,
@@ -136,7 +230,7 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
         response_too_large: bool = False,
     ):
         """Log detailed debug information."""
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         display = method_info.get("display", "unknown")
 
         # Get raw request text
@@ -145,8 +239,7 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
         if self.pretty_print_jsonrpc:
             # Pretty print with Rich panels
             try:
-                request_json = json.loads(request_text)
-                request_formatted = json.dumps(request_json, indent=2)
+                request_formatted = _json_pretty(_json_loads(request_text))
             except json.JSONDecodeError:
                 request_formatted = request_text
 
@@ -164,8 +257,7 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
             if response_body:
                 response_text = self._extract_sse_data(response_body.decode("utf-8", errors="replace"))
                 try:
-                    response_json = json.loads(response_text)
-                    response_formatted = json.dumps(response_json, indent=2)
+                    response_formatted = _json_pretty(_json_loads(response_text))
                 except json.JSONDecodeError:
                     response_formatted = response_text
                 syntax = Syntax(response_formatted, "json", theme=CODE_THEME)
@@ -174,33 +266,43 @@ class MCPLoggingMiddleware(BaseHTTPMiddleware):
                 _console.print(f"[dim]{display} Response: <response too large to display>[/dim]")
         else:
             # Plain text logging
-            print(f"\033[36mMCP:\033[0m  [{display}] Request ({duration_ms:.1f}ms): {request_text}")
+            print(f"{_MCP_DEBUG_PREFIX}[{display}] Request ({duration_ms:.1f}ms): {request_text}")
             if response_body:
                 response_text = self._extract_sse_data(response_body.decode("utf-8", errors="replace"))
-                print(f"\033[36mMCP:\033[0m  [{display}] Response: {response_text}")
+                print(f"{_MCP_DEBUG_PREFIX}[{display}] Response: {response_text}")
             elif response_too_large:
-                print(f"\033[36mMCP:\033[0m  [{display}] Response: <response too large to display>")
+                print(f"{_MCP_DEBUG_PREFIX}[{display}] Response: <response too large to display>")
 
-    async def _log_access_info(self, request: Request, method_info: dict, response: Response, start_time: float):
+    async def _log_access_info(self, scope: Scope, method_info: dict, status_code: int):
         """Log access information with MCP method stub."""
-        client_addr = f"{request.client.host}:{request.client.port}" if request.client else "unknown"
-        method = request.method
-        path = request.url.path
-        status_code = response.status_code
+        # Skip building the line when the configured access logger would drop it
+        use_logger = bool(access_logger.handlers)
+        if use_logger and not access_logger.isEnabledFor(logging.INFO):
+            return
+
+        client = scope.get("client")
+        client_addr = f"{client[0]}:{client[1]}" if client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
 
         # Get MCP method info
         display = method_info.get("display", "unknown")
 
         # Build enhanced path with MCP method stub (no session ID) - bold the method
-        enhanced_path = f"{path} [\033[1m{display}\033[0m]"
+        enhanced_path = f"{path} [{BOLD}{display}{RESET}]"
 
         # Pad HTTP method to align MCP methods
-        padded_method = f"{method:<4}"  # Left-align with 4 characters width
+        padded_method = pad_http_method(method)
 
-        # Print with MCP: prefix (green like INFO) - 2 spaces to align with "INFO: "
-        print(f'\033[32mMCP:\033[0m  {client_addr} - "{padded_method} {enhanced_path} HTTP/1.1" {status_code}')
+        # MCP: prefix (green like INFO)
+        line = f'{_MCP_ACCESS_PREFIX}{client_addr} - "{padded_method} {enhanced_path} HTTP/1.1" {status_code}'
+        if use_logger:
+            # Pre-formatted on purpose: access filters treat records with an args tuple as uvicorn's
+            access_logger.info(line)
+        else:
+            print(line)
 
     @staticmethod
     def get_method_info() -> dict | None:
-        """Get method info for current thread."""
+        """Get method info for the current request context."""
         return get_method_info()
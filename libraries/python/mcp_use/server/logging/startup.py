@@ -1,6 +1,9 @@
+import asyncio
 import time
 from typing import TYPE_CHECKING
 
+from mcp.types import Prompt, Resource, Tool
+from pydantic import TypeAdapter
 from rich.console import Console
 
 import mcp_use
@@ -10,21 +13,32 @@ from mcp_use.server.utils.utils import estimate_tokens, get_local_network_ip
 if TYPE_CHECKING:
     from mcp_use.server.server import MCPServer
 
+_TOOLS_ADAPTER = TypeAdapter(list[Tool])
+_RESOURCES_ADAPTER = TypeAdapter(list[Resource])
+_PROMPTS_ADAPTER = TypeAdapter(list[Prompt])
+
+
+def _estimate_list_tokens(adapter: TypeAdapter, items: list) -> int:
+    """Estimate tokens for a list of items serialized as a single JSON array."""
+    if not items:
+        return 0
+    return estimate_tokens(adapter.dump_json(items).decode())
+
 
 async def display_startup_info(
     server: "MCPServer", host: str, port: int, transport: TransportType | None = None, start_time: float = 0.0
 ) -> None:
     """Display Next.js-style startup information for the MCP server."""
     console = Console()
-    startup_time = time.time() - start_time  # ty error: assigning float to str
+    startup_time = time.perf_counter() - start_time  # ty error: assigning float to str
 
-    tools = await server.list_tools()
-    resources = await server.list_resources()
-    prompts = await server.list_prompts()
+    tools, resources, prompts = await asyncio.gather(
+        server.list_tools(), server.list_resources(), server.list_prompts()
+    )
 
-    tools_tokens = sum(estimate_tokens(tool.model_dump_json()) for tool in tools)
-    resources_tokens = sum(estimate_tokens(resource.model_dump_json()) for resource in resources)
-    prompts_tokens = sum(estimate_tokens(prompt.model_dump_json()) for prompt in prompts)
+    tools_tokens = _estimate_list_tokens(_TOOLS_ADAPTER, tools)
+    resources_tokens = _estimate_list_tokens(_RESOURCES_ADAPTER, resources)
+    prompts_tokens = _estimate_list_tokens(_PROMPTS_ADAPTER, prompts)
     total_tokens = tools_tokens + resources_tokens + prompts_tokens
 
     network_ip = get_local_network_ip()
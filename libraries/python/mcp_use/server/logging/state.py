@@ -1,16 +1,21 @@
 """Shared state for MCP server logging."""
 
-import threading
+from contextvars import ContextVar, Token
 
-# Thread-local storage for MCP method info
-_thread_local = threading.local()
+# Per-request (task-local) storage for MCP method info
+_mcp_method_info: ContextVar[dict | None] = ContextVar("mcp_method_info", default=None)
 
 
-def set_method_info(info: dict | None) -> None:
-    """Store method info for current thread."""
-    _thread_local.mcp_method_info = info
+def set_method_info(info: dict | None) -> Token:
+    """Store method info for the current request context."""
+    return _mcp_method_info.set(info)
+
+
+def reset_method_info(token: Token) -> None:
+    """Restore the method info that was current before the matching set_method_info call."""
+    _mcp_method_info.reset(token)
 
 
 def get_method_info() -> dict | None:
-    """Get method info for current thread."""
-    return getattr(_thread_local, "mcp_method_info", None)
+    """Get method info for the current request context."""
+    return _mcp_method_info.get()
@@ -49,22 +49,21 @@ class MiddlewareServerSession(ServerSession):
         MiddlewareServerSession._active_sessions.add(self)
 
     async def _received_request(self, responder: RequestResponder[types.ClientRequest, types.ServerResult]) -> None:
-        if responder.request.root.method and responder.request.root.method == "initialize":
-            if not self._middleware_manager:
-                # Fallback to normal behavior if middleware isn't injected yet
-                return await ServerSession._received_request(self, responder)
-
-            ctx = ServerMiddlewareContext(
-                message=responder.request.root.params,
-                method="initialize",
-                timestamp=datetime.now(),
-                transport=self._transport_type,
-                session_id=getattr(self, "session_id", None),
-            )
-
-            async def call_original(_):
-                return await ServerSession._received_request(self, responder)
-
-            return await self._middleware_manager.process_request(ctx, call_original)
-
-        return await ServerSession._received_request(self, responder)
+        root = responder.request.root
+        # Exact type check: initialize arrives once per session, every other request takes this branch
+        if type(root) is not types.InitializeRequest or not self._middleware_manager:
+            # Also falls back to normal behavior if middleware isn't injected yet
+            return await ServerSession._received_request(self, responder)
+
+        ctx = ServerMiddlewareContext(
+            message=root.params,
+            method="initialize",
+            timestamp=datetime.now(),
+            transport=self._transport_type,
+            session_id=getattr(self, "session_id", None),
+        )
+
+        async def call_original(_):
+            return await ServerSession._received_request(self, responder)
+
+        return await self._middleware_manager.process_request(ctx, call_original)
@@ -12,7 +12,7 @@ _telemetry = Telemetry()
 
 class TelemetryMiddleware(Middleware):
     async def on_call_tool(self, context: ServerMiddlewareContext[Any], call_next: CallNext[Any, Any]) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = True
         error_type: str | None = None
 
@@ -30,7 +30,7 @@ class TelemetryMiddleware(Middleware):
                 tool_name=tool_name,
                 length_input_argument=len(serialized_arguments),
                 success=success,
-                execution_time_ms=int((time.time() - start_time) * 1000),
+                execution_time_ms=int((time.perf_counter() - start_time) * 1000),
                 error_type=error_type,
             )
 
@@ -1,17 +1,15 @@
 """Server runner for different transport types."""
 
+import importlib.util
 import logging
 import socket
 import sys
-from functools import partial
-from typing import TYPE_CHECKING, get_args
+from typing import TYPE_CHECKING
 
 import anyio
-import uvicorn
 
-from mcp_use.server.logging import get_logging_config
-from mcp_use.server.logging.startup import display_startup_info
-from mcp_use.server.types import TransportType
+from mcp_use.server.types import VALID_TRANSPORTS, TransportType
+from mcp_use.server.utils.inspector import close_inspector_client
 
 if TYPE_CHECKING:
     from mcp_use.server.server import MCPServer
@@ -31,6 +29,16 @@ def _is_port_available(host: str, port: int) -> bool:
             return False
 
 
+def _backend_options() -> dict:
+    """Run the event loop on uvloop when it is installed (e.g. via the ``server`` extra).
+
+    The server is awaited inside ``anyio.run``, so uvicorn's own ``loop`` setting never applies.
+    """
+    if importlib.util.find_spec("uvloop") is not None:
+        return {"use_uvloop": True}
+    return {}
+
+
 def _find_available_port(host: str, port: int, max_retries: int = 10) -> int:
     """Find an available port starting from the given port."""
     for i in range(max_retries):
@@ -54,6 +62,12 @@ class ServerRunner:
         transport: TransportType | None = None,
         reload: bool = False,
     ) -> None:
+        # Deferred so the stdio transport never pays for uvicorn or the startup banner
+        import uvicorn
+
+        from mcp_use.server.logging import get_logging_config
+        from mcp_use.server.logging.startup import display_startup_info
+
         # Find an available port if the requested one is in use
         original_port = port
         port = _find_available_port(host, port)
@@ -74,10 +88,16 @@ class ServerRunner:
                 inspector_path=self.server.inspector_path or "/inspector",
                 mcp_logs_only=self.server.mcp_logs_only,
             ),
+            # mcp_logs_only drops every uvicorn access record, so don't produce them at all
+            access_log=self.server.access_log and not self.server.mcp_logs_only,
+            proxy_headers=self.server.proxy_headers,
             timeout_graceful_shutdown=0,  # Disable graceful shutdown
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await close_inspector_client()
 
     async def run_streamable_http_async(self, host: str = "127.0.0.1", port: int = 8000, reload: bool = False) -> None:
         """Run the server using StreamableHTTP transport."""
@@ -105,15 +125,15 @@ class ServerRunner:
             reload: Whether to enable auto-reload
         """
 
-        if transport not in get_args(TransportType):
+        if transport not in VALID_TRANSPORTS:
             raise ValueError(f"Unknown transport: {transport}")
 
         try:
             match transport:
                 case "stdio":
-                    anyio.run(self.server.run_stdio_async)
+                    anyio.run(self.server.run_stdio_async, backend_options=_backend_options())
                 case "streamable-http":
-                    anyio.run(partial(self.run_streamable_http_async, host=host, port=port, reload=reload))
+                    anyio.run(self.run_streamable_http_async, host, port, reload, backend_options=_backend_options())
                 case "sse":
                     logger.warning("SSE transport is not supported anymore. Use streamable-http instead.")
         except KeyboardInterrupt:
@@ -53,6 +53,7 @@ lowlevel.ServerSession = MiddlewareServerSession
 
 if TYPE_CHECKING:
     from mcp.server.session import ServerSession
+    from starlette.applications import Starlette
 
     from mcp_use.server.router import MCPRouter
 
@@ -91,6 +92,8 @@ class MCPServer(FastMCP):
         show_inspector_logs: bool = False,
         pretty_print_jsonrpc: bool = False,
         mcp_logs_only: bool = False,
+        access_log: bool = True,
+        proxy_headers: bool = True,
         host: str = "0.0.0.0",
         port: int = 8000,
         dns_rebinding_protection: bool = False,
@@ -113,13 +116,17 @@ class MCPServer(FastMCP):
             show_inspector_logs: Show inspector-related logs
             pretty_print_jsonrpc: Pretty print JSON-RPC messages in logs
             mcp_logs_only: Only show MCP protocol logs, suppress HTTP access logs (default: False)
+            access_log: Emit uvicorn HTTP access logs (default: True). Disable in production
+                  to skip per-request log formatting; MCP protocol lines are unaffected.
+            proxy_headers: Trust X-Forwarded-Proto/For headers from the addresses in
+                  FORWARDED_ALLOW_IPS (default: True). Disable when not behind a proxy.
             host: Default host for server binding (default: "0.0.0.0"). Can be overridden in run().
             port: Default port for server binding (default: 8000). Can be overridden in run().
             dns_rebinding_protection: Enable DNS rebinding protection by validating Host/Origin
                   headers. When True, only requests from localhost origins are accepted.
                   Recommended for local development servers. Default: False.
         """
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
         self._dns_rebinding_protection = dns_rebinding_protection
         super().__init__(
             name=name or "mcp-use server",
@@ -159,6 +166,8 @@ class MCPServer(FastMCP):
         self.show_inspector_logs = show_inspector_logs
         self.pretty_print_jsonrpc = pretty_print_jsonrpc
         self.mcp_logs_only = mcp_logs_only
+        self.access_log = access_log
+        self.proxy_headers = proxy_headers
         self._transport_type: TransportType = "streamable-http"
 
         self.middleware_manager = MiddlewareManager()
@@ -172,6 +181,8 @@ class MCPServer(FastMCP):
         if self.debug_level >= 1:
             self._add_dev_routes()
 
+        self._http_app: Starlette | None = None
+        self._http_app_key: tuple = ()
         self.app = self.streamable_http_app()
 
         # Inject middleware in the ServerSession
@@ -432,9 +443,16 @@ class MCPServer(FastMCP):
                 pass  # Session may have disconnected
 
     def streamable_http_app(self):
-        """Override to add our custom middleware."""
+        """Override to add our custom middleware.
+
+        The app is built once and reused until one of its inputs (custom routes, logging
+        options, auth, session manager) changes, see ``_http_app_inputs``.
+        """
         from starlette.middleware.cors import CORSMiddleware
 
+        if self._http_app is not None and self._http_app_key == self._http_app_inputs():
+            return self._http_app
+
         app = super().streamable_http_app()
 
         # Add MCP logging middleware (cast to satisfy type checker)
@@ -464,8 +482,21 @@ class MCPServer(FastMCP):
                 expose_headers=["WWW-Authenticate"],
             )
 
+        self._http_app = app
+        self._http_app_key = self._http_app_inputs()
         return app
 
+    def _http_app_inputs(self) -> tuple:
+        """Everything streamable_http_app() reads; a change means the cached app is stale."""
+        return (
+            len(self._custom_starlette_routes),
+            self.debug_level,
+            self.mcp_path,
+            self.pretty_print_jsonrpc,
+            self._auth,
+            self._session_manager,
+        )
+
     def _wrap_handlers_with_middleware(self) -> None:
         handlers = self._mcp_server.request_handlers
 
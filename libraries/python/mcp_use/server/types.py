@@ -1,9 +1,12 @@
 """Shared transport-related typing helpers."""
 
-from typing import Literal
+from typing import Literal, get_args
 
 # Main supported transports per MCP Protocol 2025-06-18
 # We purposefully omit "sse" as it is deprecated (Protocol 2024-11-05)
 TransportType = Literal["stdio", "streamable-http", "sse"]
 
-__all__ = ["TransportType"]
+# Runtime counterpart of TransportType for membership checks
+VALID_TRANSPORTS: frozenset[str] = frozenset(get_args(TransportType))
+
+__all__ = ["TransportType", "VALID_TRANSPORTS"]
@@ -1,5 +1,7 @@
 import logging
 import os
+import time
+from collections import OrderedDict
 from urllib.parse import urlencode
 
 import httpx
@@ -15,6 +17,54 @@ INSPECTOR_CDN_BASE_URL = os.environ.get(
 ).rstrip("/")
 INDEX_URL = f"{INSPECTOR_CDN_BASE_URL}/index.html"
 
+# In-process cache of CDN responses: url -> (content, media type, headers, expiry)
+CDN_CACHE_SIZE = 64
+CDN_CACHE_TTL = 3600.0
+CACHE_CONTROL = f"public, max-age={int(CDN_CACHE_TTL)}"
+_cache: OrderedDict[str, tuple[bytes, str, dict[str, str], float]] = OrderedDict()
+# Upstream headers forwarded so browsers can cache and revalidate assets
+FORWARDED_HEADERS = ("Cache-Control", "ETag")
+
+# Shared client so CDN fetches reuse pooled keep-alive connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared CDN client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=10.0)
+    return _client
+
+
+async def close_inspector_client() -> None:
+    """Close the shared CDN client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _cache_get(url: str) -> tuple[bytes, str, dict[str, str]] | None:
+    """Return a cached CDN response if present and not expired."""
+    entry = _cache.get(url)
+    if entry is None:
+        return None
+    content, media_type, headers, expires_at = entry
+    if expires_at < time.monotonic():
+        del _cache[url]
+        return None
+    _cache.move_to_end(url)
+    return content, media_type, headers
+
+
+def _cache_put(url: str, content: bytes, media_type: str, headers: dict[str, str] | None = None) -> None:
+    """Store a CDN response, evicting the least recently used entry when full."""
+    _cache[url] = (content, media_type, headers or {}, time.monotonic() + CDN_CACHE_TTL)
+    _cache.move_to_end(url)
+    while len(_cache) > CDN_CACHE_SIZE:
+        _cache.popitem(last=False)
+
 
 async def _inspector_index(
     request: Request,
@@ -36,18 +86,20 @@ async def _inspector_index(
         )
         return RedirectResponse(url=autoconnect_url, status_code=302)
 
+    cached = _cache_get(INDEX_URL)
+    if cached is not None:
+        return HTMLResponse(cached[0])
+
     # Fetch the CDN file
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(INDEX_URL, follow_redirects=True)
-            if response.status_code == 200:
-                html = response.text.replace('src="/inspector/assets/', f'src="{INSPECTOR_CDN_BASE_URL}/assets/')
-                html = html.replace('href="/inspector/assets/', f'href="{INSPECTOR_CDN_BASE_URL}/assets/')
-                return HTMLResponse(html)
-            else:
-                logger.warning(
-                    f"Failed to fetch inspector from CDN: {INDEX_URL} returned status {response.status_code}"
-                )
+        response = await _get_client().get(INDEX_URL, follow_redirects=True)
+        if response.status_code == 200:
+            html = response.text.replace('src="/inspector/assets/', f'src="{INSPECTOR_CDN_BASE_URL}/assets/')
+            html = html.replace('href="/inspector/assets/', f'href="{INSPECTOR_CDN_BASE_URL}/assets/')
+            _cache_put(INDEX_URL, html.encode("utf-8"), "text/html")
+            return HTMLResponse(html)
+        else:
+            logger.warning(f"Failed to fetch inspector from CDN: {INDEX_URL} returned status {response.status_code}")
     except Exception as e:
         logger.exception(f"Failed to fetch inspector from CDN: {INDEX_URL} - {e}")
 
@@ -72,15 +124,22 @@ async def _inspector_static(request: Request):
     """Serve static files from the CDN."""
     path = request.path_params.get("path", "")
     cdn_url = f"{INSPECTOR_CDN_BASE_URL}/{path}"
+    cached = _cache_get(cdn_url)
+    if cached is not None:
+        content, media_type, headers = cached
+        return Response(content=content, media_type=media_type, headers=headers)
+
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(cdn_url, follow_redirects=True)
-            if response.status_code == 200:
-                return Response(content=response.content, media_type=response.headers.get("Content-Type", "text/plain"))
-            else:
-                logger.warning(
-                    f"Failed to fetch static file from CDN: {cdn_url} returned status {response.status_code}"
-                )
+        response = await _get_client().get(cdn_url, follow_redirects=True)
+        if response.status_code == 200:
+            # Pass the raw bytes through; assets are often binary (fonts, images)
+            media_type = response.headers.get("Content-Type", "application/octet-stream")
+            headers = {name: response.headers[name] for name in FORWARDED_HEADERS if name in response.headers}
+            headers.setdefault("Cache-Control", CACHE_CONTROL)
+            _cache_put(cdn_url, response.content, media_type, headers)
+            return Response(content=response.content, media_type=media_type, headers=headers)
+        else:
+            logger.warning(f"Failed to fetch static file from CDN: {cdn_url} returned status {response.status_code}")
     except Exception as e:
         logger.exception(f"Failed to fetch static file from CDN: {cdn_url} - {e}")
 
@@ -224,6 +224,42 @@ async def run_initialize(_session):
     pass
 
 
+# Placeholder argument per JSON schema type; anything else gets "test"
+_DEFAULTS = {"number": 1, "integer": 1, "boolean": True}
+
+
+def _placeholder(prop: dict):
+    """Return a placeholder value for one schema property."""
+    prop_type = prop.get("type", "string")
+    if isinstance(prop_type, list):
+        # Union types such as ["string", "null"]: use the first non-null member
+        prop_type = next((t for t in prop_type if t != "null"), "string")
+    if not isinstance(prop_type, str):
+        return "test"
+    return _DEFAULTS.get(prop_type, "test")
+
+
+def _build_args(schema: dict) -> dict:
+    """Build placeholder arguments for every property in a tool's input schema."""
+    properties = schema.get("properties", {})
+    return {name: _placeholder(prop) for name, prop in properties.items()}
+
+
+async def _call_tools(session, tools, build_args=lambda tool: {}):
+    """Call every tool concurrently, ignoring tools that error.
+
+    The calls are independent, so the scenario takes one round-trip instead of one per tool.
+    """
+
+    async def call(tool):
+        try:
+            await session.call_tool(name=tool.name, arguments=build_args(tool))
+        except Exception:
+            pass
+
+    await asyncio.gather(*(call(tool) for tool in tools))
+
+
 async def run_tools_call(session):
     """List tools and call each one with auto-generated arguments.
 
@@ -232,22 +268,7 @@ async def run_tools_call(session):
     intentionally error (e.g., test_error_handling) — we catch and ignore those.
     """
     tools = await session.list_tools()
-    for tool in tools:
-        args = {}
-        schema = tool.inputSchema or {}
-        properties = schema.get("properties", {})
-        for param_name, param_schema in properties.items():
-            param_type = param_schema.get("type", "string")
-            if param_type in ("number", "integer"):
-                args[param_name] = 1
-            elif param_type == "boolean":
-                args[param_name] = True
-            else:
-                args[param_name] = "test"
-        try:
-            await session.call_tool(name=tool.name, arguments=args)
-        except Exception:
-            pass
+    await _call_tools(session, tools, lambda tool: _build_args(tool.inputSchema or {}))
 
 
 async def run_elicitation_defaults(session):
@@ -257,13 +278,7 @@ async def run_elicitation_defaults(session):
     that our elicitation callback returns the schema defaults.
     """
     tools = await session.list_tools()
-    for tool in tools:
-        if "elicit" not in (tool.name or "").lower():
-            continue
-        try:
-            await session.call_tool(name=tool.name, arguments={})
-        except Exception:
-            pass
+    await _call_tools(session, [tool for tool in tools if "elicit" in (tool.name or "").lower()])
 
 
 # =============================================================================
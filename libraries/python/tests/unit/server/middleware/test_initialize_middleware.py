@@ -6,15 +6,25 @@ These tests verify that:
 2. Middleware chain executes in correct order for initialize requests
 3. Middleware can reject connections by raising exceptions
 4. Context enrichment works through the middleware chain
+5. MiddlewareServerSession only routes initialize requests through middleware
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from mcp.types import ClientCapabilities, Implementation, InitializeRequestParams
+from mcp.server.session import ServerSession
+from mcp.types import (
+    ClientCapabilities,
+    ClientRequest,
+    Implementation,
+    InitializeRequest,
+    InitializeRequestParams,
+    PingRequest,
+)
 
 from mcp_use.server.middleware import Middleware, MiddlewareManager, ServerMiddlewareContext
+from mcp_use.server.middleware.server_session import MiddlewareServerSession
 
 
 class TestOnInitializeDispatch:
@@ -438,3 +448,47 @@ class TestInitializeWithClientInfo:
         assert len(logged_capabilities) == 1
         assert logged_capabilities[0]["client"] == "capable-client"
         assert logged_capabilities[0]["has_sampling"] is True
+
+
+class TestMiddlewareServerSessionRouting:
+    """Test which requests MiddlewareServerSession sends through the middleware chain."""
+
+    @pytest.fixture
+    def session(self):
+        session = MagicMock(spec=MiddlewareServerSession)
+        session._middleware_manager = MagicMock(spec=MiddlewareManager)
+        session._middleware_manager.process_request = AsyncMock(return_value="via_middleware")
+        session._transport_type = "streamable-http"
+        session.session_id = None
+        return session
+
+    @pytest.mark.asyncio
+    async def test_initialize_request_goes_through_middleware(self, session):
+        """Verify initialize requests are wrapped in a middleware context."""
+        params = InitializeRequestParams(
+            protocolVersion="2024-11-05",
+            capabilities=ClientCapabilities(),
+            clientInfo=Implementation(name="test-client", version="1.0.0"),
+        )
+        responder = MagicMock()
+        responder.request = ClientRequest(InitializeRequest(params=params))
+
+        result = await MiddlewareServerSession._received_request(session, responder)
+
+        assert result == "via_middleware"
+        context = session._middleware_manager.process_request.call_args.args[0]
+        assert context.method == "initialize"
+        assert context.message is params
+
+    @pytest.mark.asyncio
+    async def test_other_requests_bypass_middleware(self, session):
+        """Verify non-initialize requests go straight to the SDK session."""
+        responder = MagicMock()
+        responder.request = ClientRequest(PingRequest())
+
+        with patch.object(ServerSession, "_received_request", new=AsyncMock(return_value="direct")) as original:
+            result = await MiddlewareServerSession._received_request(session, responder)
+
+        assert result == "direct"
+        original.assert_awaited_once_with(session, responder)
+        session._middleware_manager.process_request.assert_not_called()
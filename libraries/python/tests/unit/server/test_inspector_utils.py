@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import pytest
 from starlette.requests import Request
 
@@ -24,8 +26,11 @@ class _FakeResponse:
 
 
 class _FakeAsyncClient:
+    is_closed = False
+
     def __init__(self, response: _FakeResponse):
         self._response = response
+        self.calls = 0
 
     async def __aenter__(self) -> _FakeAsyncClient:
         return self
@@ -34,6 +39,7 @@ class _FakeAsyncClient:
         return None
 
     async def get(self, url: str, *, follow_redirects: bool = True) -> _FakeResponse:
+        self.calls += 1
         return self._response
 
 
@@ -74,6 +80,8 @@ async def test_inspector_index_rewrites_asset_paths_for_custom_mount(monkeypatch
     </html>
     """
 
+    monkeypatch.setattr(inspector_utils, "_client", None)
+    monkeypatch.setattr(inspector_utils, "_cache", OrderedDict())
     monkeypatch.setattr(
         inspector_utils.httpx,
         "AsyncClient",
@@ -93,6 +101,69 @@ async def test_inspector_index_rewrites_asset_paths_for_custom_mount(monkeypatch
     assert "/inspector/assets/" not in body
 
 
+@pytest.mark.anyio
+async def test_inspector_static_reuses_shared_client_and_cache(monkeypatch):
+    created = []
+
+    def _make_client(timeout=10.0):
+        client = _FakeAsyncClient(_FakeResponse(status_code=200, content=b"body", headers={"Content-Type": "text/css"}))
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(inspector_utils, "_client", None)
+    monkeypatch.setattr(inspector_utils, "_cache", OrderedDict())
+    monkeypatch.setattr(inspector_utils.httpx, "AsyncClient", _make_client)
+
+    request = _make_request("/inspector/assets/index.css")
+    request.scope["path_params"] = {"path": "assets/index.css"}
+    first = await inspector_utils._inspector_static(request)
+    second = await inspector_utils._inspector_static(request)
+
+    assert first.body == second.body == b"body"
+    assert second.headers["cache-control"] == inspector_utils.CACHE_CONTROL
+    assert len(created) == 1
+    assert created[0].calls == 1
+
+
+@pytest.mark.anyio
+async def test_inspector_cache_expires_and_evicts(monkeypatch):
+    monkeypatch.setattr(inspector_utils, "_cache", OrderedDict())
+    monkeypatch.setattr(inspector_utils, "CDN_CACHE_SIZE", 2)
+
+    inspector_utils._cache_put("a", b"a", "text/plain")
+    inspector_utils._cache_put("b", b"b", "text/plain")
+    assert inspector_utils._cache_get("a") == (b"a", "text/plain", {})
+    inspector_utils._cache_put("c", b"c", "text/plain")
+    assert list(inspector_utils._cache) == ["a", "c"]
+
+    monkeypatch.setattr(inspector_utils, "CDN_CACHE_TTL", -1.0)
+    inspector_utils._cache_put("d", b"d", "text/plain")
+    assert inspector_utils._cache_get("d") is None
+    assert "d" not in inspector_utils._cache
+
+
+@pytest.mark.anyio
+async def test_inspector_static_forwards_raw_bytes_and_upstream_headers(monkeypatch):
+    content = b"\x00\x01wOFF\xff"
+    upstream = _FakeResponse(
+        status_code=200,
+        content=content,
+        headers={"Content-Type": "font/woff2", "Cache-Control": "public, max-age=60", "ETag": '"abc"'},
+    )
+    monkeypatch.setattr(inspector_utils, "_client", None)
+    monkeypatch.setattr(inspector_utils, "_cache", OrderedDict())
+    monkeypatch.setattr(inspector_utils.httpx, "AsyncClient", lambda timeout=10.0: _FakeAsyncClient(upstream))
+
+    request = _make_request("/inspector/assets/font.woff2")
+    request.scope["path_params"] = {"path": "assets/font.woff2"}
+    response = await inspector_utils._inspector_static(request)
+
+    assert response.body == content
+    assert response.headers["content-type"] == "font/woff2"
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.headers["etag"] == '"abc"'
+
+
 def test_server_normalizes_inspector_prefix_and_legacy_full_path():
     from mcp_use.server.server import MCPServer
 
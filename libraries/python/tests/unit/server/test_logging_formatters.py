@@ -0,0 +1,43 @@
+"""Tests for MCP server log formatters."""
+
+import logging
+
+from mcp_use.server.logging.formatters import GREEN, RED, RESET, MCPAccessFormatter, MCPErrorFormatter, pad_http_method
+
+
+def _make_record(msg: str, level: int = logging.ERROR) -> logging.LogRecord:
+    return logging.LogRecord("uvicorn.error", level, "", 0, msg, None, None)
+
+
+class TestMCPErrorFormatter:
+    """Tests for the friendly error formatter."""
+
+    def test_port_conflict_message(self):
+        record = _make_record(
+            "[Errno 98] error while attempting to bind on address ('0.0.0.0', 8000): Address already in use"
+        )
+
+        formatted = MCPErrorFormatter().format(record)
+
+        assert formatted.startswith("Port 8000 is already in use.")
+
+    def test_other_errors_pass_through(self):
+        assert MCPErrorFormatter().format(_make_record("boom")) == "boom"
+
+
+class TestMCPAccessFormatter:
+    """Tests for the MCP-aware access log formatter."""
+
+    def test_level_prefix(self):
+        formatter = MCPAccessFormatter()
+
+        assert formatter._add_level_prefix("INFO", "msg") == f"{GREEN}INFO:{RESET} msg"
+        assert formatter._add_level_prefix("ERROR", "msg") == f"{RED}ERROR:{RESET} msg"
+        assert formatter._add_level_prefix("CRITICAL", "msg") == "CRITICAL: msg"
+
+
+def test_pad_http_method():
+    assert pad_http_method("GET") == "GET "
+    assert pad_http_method("POST") == "POST"
+    assert pad_http_method("DELETE") == "DELETE"
+    assert pad_http_method("FOO") == "FOO "
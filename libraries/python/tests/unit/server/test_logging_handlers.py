@@ -0,0 +1,84 @@
+"""Tests for MCP server log handlers."""
+
+import io
+import logging
+import logging.config
+
+import pytest
+
+from mcp_use.server.logging.config import setup_logging
+from mcp_use.server.logging.formatters import MCPAccessFormatter
+from mcp_use.server.logging.handlers import QueuedStreamHandler
+
+
+def _make_access_record(path: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="uvicorn.access",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg='%s - "%s %s HTTP/%s" %d',
+        args=("127.0.0.1:5000", "GET", path, "1.1", 200),
+        exc_info=None,
+    )
+
+
+class TestQueuedStreamHandler:
+    """Tests for the background-thread stream handler."""
+
+    def test_writes_formatted_records_after_close(self):
+        stream = io.StringIO()
+        handler = QueuedStreamHandler(stream)
+        handler.setFormatter(MCPAccessFormatter())
+
+        handler.handle(_make_access_record("/docs"))
+        handler.handle(_make_access_record("/health"))
+        handler.close()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert '"GET /docs HTTP/1.1" 200' in lines[0]
+        assert '"GET /health HTTP/1.1" 200' in lines[1]
+
+    def test_close_is_idempotent(self):
+        handler = QueuedStreamHandler(io.StringIO())
+        handler.close()
+        handler.close()
+
+    def test_access_handler_in_logging_config(self):
+        access_handler = setup_logging()["handlers"]["access"]
+
+        assert access_handler["class"] == f"{QueuedStreamHandler.__module__}.{QueuedStreamHandler.__qualname__}"
+        assert access_handler["stream"] == "ext://sys.stdout"
+
+
+class TestLoggingConfigApplies:
+    """Tests that the generated config is accepted by logging.config.dictConfig."""
+
+    @pytest.fixture
+    def restore_loggers(self):
+        """Snapshot the loggers touched by dictConfig and restore them afterwards."""
+        names = list(setup_logging(debug_level=2)["loggers"])
+        saved = {}
+        for name in names:
+            logger = logging.getLogger(name)
+            saved[name] = (list(logger.handlers), logger.level, logger.propagate, logger.disabled)
+        yield
+        for name, (handlers, level, propagate, disabled) in saved.items():
+            logger = logging.getLogger(name)
+            for handler in logger.handlers:
+                if handler not in handlers:
+                    handler.close()
+            logger.handlers[:] = handlers
+            logger.setLevel(level)
+            logger.propagate = propagate
+            logger.disabled = disabled
+
+    @pytest.mark.parametrize("debug_level", [0, 2])
+    def test_dict_config_accepts_queued_handlers(self, restore_loggers, debug_level):
+        logging.config.dictConfig(setup_logging(debug_level=debug_level))
+
+        access_handlers = logging.getLogger("mcp.access").handlers
+        assert any(isinstance(handler, QueuedStreamHandler) for handler in access_handlers)
+        if debug_level >= 2:
+            assert any(isinstance(handler, QueuedStreamHandler) for handler in logging.getLogger("mcp.debug").handlers)
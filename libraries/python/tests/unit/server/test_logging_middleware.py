@@ -0,0 +1,284 @@
+"""Tests for MCPLoggingMiddleware request parsing."""
+
+import json
+import logging
+from unittest.mock import Mock
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from mcp_use.server.logging.config import setup_logging
+from mcp_use.server.logging.middleware import MCPLoggingMiddleware, access_logger
+from mcp_use.server.logging.state import get_method_info
+
+
+@pytest.fixture
+def middleware():
+    return MCPLoggingMiddleware(app=None)
+
+
+def _body(method: str, params: dict | None = None, request_id: int = 1) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}).encode()
+
+
+class TestParseMcpMethod:
+    """Tests for extracting JSON-RPC method info from request bodies."""
+
+    @pytest.mark.parametrize(
+        ("method", "params", "name", "display"),
+        [
+            ("tools/call", {"name": "add"}, "add", "tools/call:add"),
+            ("resources/read", {"uri": "file:///docs/readme.md"}, "readme.md", "resources/read:readme.md"),
+            ("resources/read", {"uri": "config"}, "config", "resources/read:config"),
+            ("prompts/get", {"name": "greet"}, "greet", "prompts/get:greet"),
+            ("tools/list", {}, None, "tools/list"),
+            ("tools/call", {}, None, "tools/call"),
+        ],
+    )
+    def test_extracts_method_and_name(self, middleware, method, params, name, display):
+        info = middleware._parse_mcp_method(_body(method, params, request_id=7))
+
+        assert info == {"method": method, "name": name, "display": display, "session_id": 7}
+
+    def test_missing_method_is_unknown(self, middleware):
+        info = middleware._parse_mcp_method(b'{"jsonrpc": "2.0", "id": 1}')
+
+        assert info["method"] == "unknown"
+        assert info["display"] == "unknown"
+
+    @pytest.mark.parametrize("method", ["tools/list", "notifications/initialized", "ping"])
+    def test_simple_methods_skip_full_parse(self, middleware, monkeypatch, method):
+        monkeypatch.setattr("mcp_use.server.logging.middleware._json_loads", Mock(side_effect=AssertionError))
+
+        info = middleware._parse_mcp_method(_body(method, request_id=3))
+
+        assert info == {"method": method, "name": None, "display": method, "session_id": 3}
+
+    def test_string_id_and_missing_id(self, middleware):
+        with_string_id = middleware._parse_mcp_method(b'{"jsonrpc": "2.0", "id": "abc", "method": "ping"}')
+        notification = middleware._parse_mcp_method(b'{"jsonrpc": "2.0", "method": "notifications/initialized"}')
+
+        assert with_string_id["session_id"] == "abc"
+        assert notification["session_id"] is None
+
+    def test_ambiguous_bodies_fall_back_to_full_parse(self, middleware):
+        body = b'{"jsonrpc": "2.0", "params": {"meta": {"method": "x", "id": 9}}, "id": 1, "method": "tools/list"}'
+
+        info = middleware._parse_mcp_method(body)
+
+        assert info == {"method": "tools/list", "name": None, "display": "tools/list", "session_id": 1}
+
+    @pytest.mark.parametrize(
+        ("method", "params"),
+        [("tools/call", ["add"]), ("prompts/get", "greet"), ("resources/read", {"uri": 42})],
+    )
+    def test_non_dict_params_have_no_name(self, middleware, method, params):
+        body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params}).encode()
+
+        info = middleware._parse_mcp_method(body)
+
+        assert info == {"method": method, "name": None, "display": method, "session_id": 1}
+
+    def test_nested_method_key_is_not_top_level(self, middleware):
+        body = b'{"jsonrpc":"2.0","id":5,"result":{"action":"accept","content":{"method":"email"}}}'
+
+        info = middleware._parse_mcp_method(body)
+
+        assert info == {"method": "unknown", "name": None, "display": "unknown", "session_id": 5}
+
+    def test_nested_id_key_is_not_request_id(self, middleware):
+        body = b'{"jsonrpc":"2.0","method":"notifications/progress","params":{"id":3}}'
+
+        info = middleware._parse_mcp_method(body)
+
+        assert info["method"] == "notifications/progress"
+        assert info["session_id"] is None
+
+    @pytest.mark.parametrize("body", [b"", b"not json", b"\xff\xfe"])
+    def test_invalid_body_returns_none(self, middleware, body):
+        assert middleware._parse_mcp_method(body) is None
+
+
+class TestDispatch:
+    """Tests for which requests the middleware inspects."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "scope",
+        [
+            {"type": "http", "method": "GET", "path": "/mcp"},
+            {"type": "http", "method": "POST", "path": "/other"},
+            {"type": "lifespan"},
+        ],
+    )
+    async def test_non_mcp_requests_pass_through_without_reading_body(self, scope):
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append((receive, send))
+
+        async def receive():
+            raise AssertionError("body should not be read")
+
+        async def send(message):
+            pass
+
+        await MCPLoggingMiddleware(app)(scope, receive, send)
+
+        assert calls == [(receive, send)]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_mid_body_is_forwarded(self, capsys):
+        received = []
+
+        async def app(scope, receive, send):
+            received.append(await receive())
+
+        messages = iter(
+            [
+                {"type": "http.request", "body": b'{"jsonrpc":"2.0","id":1,"meth', "more_body": True},
+                {"type": "http.disconnect"},
+            ]
+        )
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            pass
+
+        scope = {"type": "http", "method": "POST", "path": "/mcp"}
+        await MCPLoggingMiddleware(app)(scope, receive, send)
+
+        assert received == [{"type": "http.disconnect"}]
+        assert capsys.readouterr().out == ""
+
+    def test_mcp_request_body_reaches_endpoint(self, capsys):
+        async def echo(request):
+            return JSONResponse(await request.json())
+
+        app = Starlette(routes=[Route("/mcp", echo, methods=["POST"])], middleware=[Middleware(MCPLoggingMiddleware)])
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "add"}}
+
+        response = TestClient(app).post("/mcp", json=payload)
+
+        assert response.json() == payload
+        assert "tools/call:add" in capsys.readouterr().out
+
+    def test_array_params_reach_endpoint(self):
+        async def echo(request):
+            return JSONResponse(await request.json())
+
+        app = Starlette(routes=[Route("/mcp", echo, methods=["POST"])], middleware=[Middleware(MCPLoggingMiddleware)])
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": ["a"]}
+
+        response = TestClient(app).post("/mcp", json=payload)
+
+        assert response.status_code == 200
+        assert response.json() == payload
+
+    def test_streamed_response_captured_for_debug_output(self, capsys):
+        async def stream(request):
+            async def chunks():
+                yield b'event: message\ndata: {"result": '
+                yield b'{"ok": true}}\n\n'
+
+            return StreamingResponse(chunks(), media_type="text/event-stream")
+
+        app = Starlette(
+            routes=[Route("/mcp", stream, methods=["POST"])],
+            middleware=[Middleware(MCPLoggingMiddleware, debug_level=2)],
+        )
+
+        response = TestClient(app).post("/mcp", content=_body("tools/list"))
+
+        out = capsys.readouterr().out
+        assert response.status_code == 200
+        assert response.text.startswith("event: message")
+        assert '"POST /mcp [\033[1mtools/list\033[0m] HTTP/1.1" 200' in out
+        assert '[tools/list] Response: {"result": {"ok": true}}' in out
+
+
+class TestDebugOutput:
+    """Tests for pretty-printed JSON-RPC debug output."""
+
+    @pytest.mark.asyncio
+    async def test_pretty_print_indents_request_and_response(self, monkeypatch):
+        middleware = MCPLoggingMiddleware(app=None, pretty_print_jsonrpc=True)
+        printed = []
+        monkeypatch.setattr(
+            "mcp_use.server.logging.middleware._console.print", lambda panel: printed.append(panel.renderable.code)
+        )
+
+        await middleware._log_debug_info(
+            method_info={"display": "tools/call:add"},
+            request_body=_body("tools/call", {"name": "add"}),
+            response_body=b'event: message\ndata: {"result": {"ok": true}}\n\n',
+            start_time=0.0,
+        )
+
+        assert printed[0].startswith('{\n  "jsonrpc": "2.0"')
+        assert printed[1] == '{\n  "result": {\n    "ok": true\n  }\n}'
+
+
+class TestAccessLog:
+    """Tests for where MCP access lines are written."""
+
+    SCOPE = {"type": "http", "method": "POST", "path": "/mcp", "client": ("127.0.0.1", 5000)}
+
+    @pytest.mark.asyncio
+    async def test_prints_when_access_logger_not_configured(self, middleware, capsys):
+        await middleware._log_access_info(self.SCOPE, {"display": "tools/list"}, 200)
+
+        assert '127.0.0.1:5000 - "POST /mcp [\033[1mtools/list\033[0m] HTTP/1.1" 200' in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_logs_through_configured_access_logger(self, middleware, capsys):
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        level = access_logger.level
+        access_logger.addHandler(handler)
+        access_logger.setLevel(logging.INFO)
+        try:
+            await middleware._log_access_info(self.SCOPE, {"display": "tools/list"}, 200)
+        finally:
+            access_logger.removeHandler(handler)
+            access_logger.setLevel(level)
+
+        assert capsys.readouterr().out == ""
+        assert "tools/list" in records[0].getMessage()
+        assert "mcp.access" in setup_logging()["loggers"]
+
+    @pytest.mark.asyncio
+    async def test_skips_line_when_access_logger_level_disabled(self, middleware, capsys, monkeypatch):
+        handler = logging.Handler()
+        handler.emit = Mock(side_effect=AssertionError("should not emit"))
+        level = access_logger.level
+        access_logger.addHandler(handler)
+        access_logger.setLevel(logging.WARNING)
+        monkeypatch.setattr("mcp_use.server.logging.middleware.pad_http_method", Mock(side_effect=AssertionError))
+        try:
+            await middleware._log_access_info(self.SCOPE, {"display": "tools/list"}, 200)
+        finally:
+            access_logger.removeHandler(handler)
+            access_logger.setLevel(level)
+
+        assert capsys.readouterr().out == ""
+
+    def test_method_info_visible_during_request_and_cleared_after(self):
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(get_method_info())
+            await JSONResponse({})(scope, receive, send)
+
+        middleware = MCPLoggingMiddleware(app)
+        TestClient(middleware).post("/mcp", content=_body("tools/call", {"name": "add"}))
+
+        assert seen[0]["display"] == "tools/call:add"
+        assert get_method_info() is None
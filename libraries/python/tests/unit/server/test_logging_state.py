@@ -0,0 +1,32 @@
+"""Tests for per-request MCP logging state."""
+
+import asyncio
+
+import pytest
+
+from mcp_use.server.logging.state import get_method_info, reset_method_info, set_method_info
+
+
+@pytest.mark.asyncio
+async def test_method_info_is_isolated_between_concurrent_requests():
+    async def handle(display: str) -> dict | None:
+        set_method_info({"display": display})
+        await asyncio.sleep(0)
+        return get_method_info()
+
+    first, second = await asyncio.gather(handle("tools/call:a"), handle("tools/call:b"))
+
+    assert first == {"display": "tools/call:a"}
+    assert second == {"display": "tools/call:b"}
+    assert get_method_info() is None
+
+
+def test_reset_restores_previous_method_info():
+    outer = set_method_info({"display": "outer"})
+    inner = set_method_info({"display": "inner"})
+
+    reset_method_info(inner)
+    assert get_method_info() == {"display": "outer"}
+
+    reset_method_info(outer)
+    assert get_method_info() is None
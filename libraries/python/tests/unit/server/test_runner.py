@@ -1,10 +1,12 @@
-"""Tests for server runner port-finding utilities."""
+"""Tests for server runner utilities and uvicorn configuration."""
 
 import socket
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from mcp_use.server.runner import _find_available_port, _is_port_available
+from mcp_use.server import MCPServer
+from mcp_use.server.runner import ServerRunner, _backend_options, _find_available_port, _is_port_available
 
 
 def test_is_port_available_returns_true_for_free_port():
@@ -73,3 +75,62 @@ def test_find_available_port_raises_when_all_exhausted():
     finally:
         for s in sockets:
             s.close()
+
+
+def test_backend_options_use_uvloop_when_installed():
+    """Test that uvloop is requested from anyio only when it can be imported."""
+    with patch("mcp_use.server.runner.importlib.util.find_spec", return_value=object()):
+        assert _backend_options() == {"use_uvloop": True}
+    with patch("mcp_use.server.runner.importlib.util.find_spec", return_value=None):
+        assert _backend_options() == {}
+
+
+async def _serve_config(server: MCPServer):
+    """Run serve_starlette_app with uvicorn stubbed out and return the uvicorn.Config it built."""
+    with (
+        patch("mcp_use.server.logging.startup.display_startup_info", new=AsyncMock()),
+        patch("uvicorn.Server") as server_cls,
+    ):
+        server_cls.return_value.serve = AsyncMock()
+        await ServerRunner(server).serve_starlette_app(server.app, port=_free_port())
+    return server_cls.call_args.args[0]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_uvicorn_config_defaults():
+    """Test that access logs and proxy headers stay on by default and the server header is dropped."""
+    config = await _serve_config(MCPServer(name="test-server"))
+    assert config.access_log is True
+    assert config.proxy_headers is True
+
+
+@pytest.mark.asyncio
+async def test_uvicorn_config_toggles():
+    """Test that MCPServer options turn off uvicorn access logs and proxy header handling."""
+    config = await _serve_config(MCPServer(name="test-server", access_log=False, proxy_headers=False))
+    assert config.access_log is False
+    assert config.proxy_headers is False
+
+    config = await _serve_config(MCPServer(name="test-server", mcp_logs_only=True))
+    assert config.access_log is False
+
+
+def test_run_rejects_unknown_transport():
+    """Test that run() validates the transport before starting anything."""
+    with pytest.raises(ValueError, match="Unknown transport: websocket"):
+        ServerRunner(MCPServer(name="test-server")).run(transport="websocket")
+
+
+def test_run_passes_http_arguments_to_anyio():
+    """Test that run() hands host, port and reload straight to the HTTP coroutine."""
+    runner = ServerRunner(MCPServer(name="test-server"))
+    with patch("mcp_use.server.runner.anyio.run") as anyio_run:
+        runner.run(transport="streamable-http", host="127.0.0.1", port=9000, reload=False)
+
+    assert anyio_run.call_args.args == (runner.run_streamable_http_async, "127.0.0.1", 9000, False)
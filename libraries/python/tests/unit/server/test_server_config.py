@@ -8,14 +8,17 @@ These tests verify that:
 4. Settings are correctly passed to FastMCP
 5. Debug routes are registered correctly
 6. Icons parameter is passed through to FastMCP
+7. The Starlette app is built once and rebuilt only when routes change
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from mcp.types import Icon
 
 from mcp_use.server import MCPServer
+from mcp_use.server.logging import MCPLoggingMiddleware
+from mcp_use.server.runner import ServerRunner
 
 
 class TestMCPServerDefaults:
@@ -129,6 +132,71 @@ class TestDebugRoutes:
         assert server.debug_level == 1
 
 
+class TestDebugEnv:
+    """Test the DEBUG environment variable handling."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("0", 0), ("1", 1), ("2", 2), ("5", 2), ("true", 1), ("verbose", 2), ("nope", 0)],
+    )
+    def test_parse_debug_level(self, monkeypatch, value, expected):
+        """DEBUG values are clamped to 0-2 and accept named levels."""
+        monkeypatch.setenv("DEBUG", value)
+        assert MCPServer(name="test-server")._parse_debug_level() == expected
+
+    def test_env_level_overrides_debug_parameter(self, monkeypatch):
+        """DEBUG set after import takes precedence over debug=False."""
+        monkeypatch.setenv("DEBUG", "2")
+        server = MCPServer(name="test-server", debug=False)
+        assert server.debug_level == 2
+
+
+class TestStreamableHttpAppCache:
+    """Test that the Starlette app is reused between init and run."""
+
+    def test_app_reused_when_routes_unchanged(self):
+        """streamable_http_app() should return the app built in __init__."""
+        server = MCPServer(name="test-server")
+        assert server.streamable_http_app() is server.app
+
+    def test_app_rebuilt_after_custom_route_added(self):
+        """Routes registered after init should be included in a rebuilt app."""
+        server = MCPServer(name="test-server")
+
+        @server.custom_route("/health", methods=["GET"])
+        async def health(request):
+            return None
+
+        app = server.streamable_http_app()
+        assert app is not server.app
+        assert "/health" in [getattr(r, "path", None) for r in app.routes]
+        assert server.streamable_http_app() is app
+
+    def test_app_rebuilt_after_logging_option_changed(self):
+        """Options changed after init should reach the middleware of the app that is served."""
+        server = MCPServer(name="test-server")
+        server.pretty_print_jsonrpc = True
+
+        app = server.streamable_http_app()
+
+        assert app is not server.app
+        logging_middleware = next(m for m in app.user_middleware if m.cls is MCPLoggingMiddleware)
+        assert logging_middleware.kwargs["pretty_print_jsonrpc"] is True
+
+    @pytest.mark.asyncio
+    async def test_runner_serves_app_with_current_settings(self):
+        """The runner should serve an app built from the settings at start time."""
+        server = MCPServer(name="test-server")
+        server.mcp_path = "/rpc"
+
+        with patch("mcp_use.server.runner.ServerRunner.serve_starlette_app", new=AsyncMock()) as serve:
+            await ServerRunner(server).run_streamable_http_async()
+
+        app = serve.call_args.args[0]
+        logging_middleware = next(m for m in app.user_middleware if m.cls is MCPLoggingMiddleware)
+        assert logging_middleware.kwargs["mcp_path"] == "/rpc"
+
+
 class TestServerIcons:
     """Test that the icons parameter propagates to FastMCP."""
 
@@ -5,6 +5,7 @@ Tests the code execution functionality for MCP code mode.
 """
 
 import asyncio
+import sys
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
@@ -123,6 +124,117 @@ return data
         assert result["result"]["items"] == [1, 2, 3]
 
 
+class TestCodeExecutorConnections:
+    """Test lazy server connection before execution."""
+
+    @pytest.mark.asyncio
+    async def test_connects_once_until_invalidated(self, mock_client, code_executor):
+        """Test that the subset check is skipped once all servers are connected."""
+        mock_client.get_server_names = Mock(return_value=["server1"])
+        mock_client.create_all_sessions = AsyncMock()
+
+        await code_executor.execute("return 1", timeout=5.0)
+        await code_executor.execute("return 1", timeout=5.0)
+        assert mock_client.create_all_sessions.await_count == 1
+        assert mock_client.get_server_names.call_count == 1
+
+        code_executor.invalidate_connections()
+        await code_executor.execute("return 1", timeout=5.0)
+        assert mock_client.create_all_sessions.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_server_added_between_executions_is_connected(self):
+        """Test that a server added after the first execution gets connected and a namespace."""
+        client = MCPClient(config={"mcpServers": {"first": {"url": "http://first"}}}, code_mode=True)
+
+        def make_session():
+            tool = Mock()
+            tool.name = "ping"
+            tool.description = "Ping"
+            tool.inputSchema = {}
+            session = AsyncMock()
+            session.list_tools = AsyncMock(return_value=[tool])
+            return session
+
+        async def create_all_sessions():
+            for name in client.get_server_names():
+                client.sessions.setdefault(name, make_session())
+
+        client.create_all_sessions = AsyncMock(side_effect=create_all_sessions)
+
+        first = await client.execute_code("return sorted(__tool_namespaces)", timeout=5.0)
+        assert "first" in first["result"]
+        assert "second" not in first["result"]
+
+        client.add_server("second", {"url": "http://second"})
+        second = await client.execute_code("return sorted(__tool_namespaces)", timeout=5.0)
+        assert {"first", "second"} <= set(second["result"])
+        assert client.create_all_sessions.await_count == 2
+
+
+class TestCodeExecutorOutputCapture:
+    """Test capture of output written to stdout/stderr during execution."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_executions_capture_own_output(self, mock_client, code_executor):
+        """Test that concurrent executions do not see each other's stdout."""
+        mock_session = AsyncMock()
+        mock_tool = Mock()
+        mock_tool.name = "echo"
+        mock_tool.description = "Echo"
+        mock_tool.inputSchema = {}
+
+        async def call_tool(name, arguments):
+            await asyncio.sleep(0.05)
+            print(f"tool output {arguments['tag']}")
+            return Mock(content=[Mock(text="ok")])
+
+        mock_session.list_tools = AsyncMock(return_value=[mock_tool])
+        mock_session.call_tool = AsyncMock(side_effect=call_tool)
+        mock_client.sessions = {"server": mock_session}
+        mock_client.get_session = Mock(return_value=mock_session)
+
+        first, second = await asyncio.gather(
+            code_executor.execute("return await server.echo(tag='a')", timeout=5.0),
+            code_executor.execute("return await server.echo(tag='b')", timeout=5.0),
+        )
+
+        assert first["logs"] == ["tool output a"]
+        assert second["logs"] == ["tool output b"]
+
+    @pytest.mark.asyncio
+    async def test_streams_restored_after_last_execution(self, mock_client, code_executor):
+        """Test that sys.stdout/sys.stderr are only wrapped while executions are in flight."""
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+        mock_session = AsyncMock()
+        mock_tool = Mock()
+        mock_tool.name = "echo"
+        mock_tool.description = "Echo"
+        mock_tool.inputSchema = {}
+
+        async def call_tool(name, arguments):
+            await asyncio.sleep(arguments["delay"])
+            assert sys.stdout is not original_stdout
+            print(f"tool output {arguments['delay']}")
+            return Mock(content=[Mock(text="ok")])
+
+        mock_session.list_tools = AsyncMock(return_value=[mock_tool])
+        mock_session.call_tool = AsyncMock(side_effect=call_tool)
+        mock_client.sessions = {"server": mock_session}
+        mock_client.get_session = Mock(return_value=mock_session)
+
+        # The short execution finishes first; the long one must keep capturing until it is done
+        short, long = await asyncio.gather(
+            code_executor.execute("return await server.echo(delay=0.01)", timeout=5.0),
+            code_executor.execute("return await server.echo(delay=0.1)", timeout=5.0),
+        )
+
+        assert short["logs"] == ["tool output 0.01"]
+        assert long["logs"] == ["tool output 0.1"]
+        assert sys.stdout is original_stdout
+        assert sys.stderr is original_stderr
+
+
 class TestCodeExecutorSecurity:
     """Test security restrictions in code execution."""
 
@@ -331,6 +443,36 @@ return {"result": result}
         assert result["result"]["result"] == "operation result"
         mock_session.call_tool.assert_called_once_with("test_operation", {"param1": "value1"})
 
+    @pytest.mark.asyncio
+    async def test_tool_wrapper_parses_json_result(self, mock_client, code_executor):
+        """Test that JSON tool results are decoded and prose is returned as-is."""
+        mock_session = AsyncMock()
+        mock_tool = Mock()
+        mock_tool.name = "get_data"
+        mock_tool.description = "Get data"
+        mock_tool.inputSchema = {}
+
+        mock_session.list_tools = AsyncMock(return_value=[mock_tool])
+        mock_session.call_tool = AsyncMock(
+            side_effect=[
+                Mock(content=[Mock(text=' {"value": 42}')]),
+                Mock(content=[Mock(text="Not JSON")]),
+                Mock(content=[Mock(text="[1, 2")]),
+            ]
+        )
+
+        mock_client.sessions = {"testserver": mock_session}
+        mock_client.get_session = Mock(return_value=mock_session)
+
+        code = """
+return [await testserver.get_data(), await testserver.get_data(), await testserver.get_data()]
+"""
+
+        result = await code_executor.execute(code, timeout=5.0)
+
+        assert result["error"] is None
+        assert result["result"] == [{"value": 42}, "Not JSON", "[1, 2"]
+
 
 class TestCodeExecutorErrorHandling:
     """Test error handling in code execution."""
@@ -104,6 +104,18 @@ class TestEnumHandling(unittest.TestCase):
         self.assertIn("type", nested_props["code_type"])
         self.assertEqual(nested_props["code_type"]["type"], "string")
 
+    def test_fix_schema_handles_deeply_nested_schema(self):
+        """Test that very deep schemas are fixed without hitting the recursion limit."""
+        schema = leaf = {"items": {"type": ["string", "null"], "enum": ["a", None]}}
+        for _ in range(5000):
+            schema = {"type": "array", "items": schema}
+
+        fixed_schema = self.adapter.fix_schema(schema)
+
+        self.assertIs(fixed_schema, schema)
+        self.assertEqual(leaf["items"]["anyOf"], [{"type": "string"}, {"type": "null"}])
+        self.assertEqual(leaf["items"]["type"], "string")
+
 
 if __name__ == "__main__":
     unittest.main()
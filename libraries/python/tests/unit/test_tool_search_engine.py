@@ -0,0 +1,128 @@
+"""
+Unit tests for ToolSearchEngine semantic search.
+
+Uses a deterministic fake embedding function instead of loading a fastembed model.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_use.agents.managers.tools.search_tools import ToolSearchEngine
+
+np = pytest.importorskip("numpy")
+
+VECTORS = {
+    "weather: get the weather": [1.0, 0.0, 0.0],
+    "github: open a pull request": [0.0, 1.0, 0.0],
+    "slack: post a message": [0.6, 0.8, 0.0],
+    "empty: nothing": [0.0, 0.0, 0.0],
+    "forecast query": [2.0, 0.1, 0.0],
+    "forecast: query": [2.0, 0.1, 0.0],
+}
+
+
+def make_tool(name: str, description: str) -> Mock:
+    tool = Mock()
+    tool.name = name
+    tool.description = description
+    return tool
+
+
+@pytest.fixture
+def engine():
+    """Create a ToolSearchEngine with a fake embedding model."""
+    engine = ToolSearchEngine()
+    engine.model = object()
+    engine.embedding_function = Mock(side_effect=lambda texts: [np.asarray(VECTORS[text]) for text in texts])
+    return engine
+
+
+@pytest.fixture
+def server_tools():
+    return {
+        "server_a": [make_tool("weather", "Get the weather"), make_tool("github", "Open a pull request")],
+        "server_b": [make_tool("slack", "Post a message"), make_tool("empty", "Nothing")],
+    }
+
+
+class TestToolSearchEngineSearch:
+    """Test ranking of semantic search results."""
+
+    @pytest.mark.asyncio
+    async def test_results_ranked_by_cosine_similarity(self, engine, server_tools):
+        """Test that results are ordered by cosine similarity to the query."""
+        await engine.index_tools(server_tools)
+
+        results = engine.search("forecast query", top_k=3)
+
+        assert [(tool.name, server) for tool, server, _ in results] == [
+            ("weather", "server_a"),
+            ("slack", "server_b"),
+            ("github", "server_a"),
+        ]
+        query = np.asarray(VECTORS["forecast query"])
+        expected = 0.6 * query[0] / np.linalg.norm(query) + 0.8 * query[1] / np.linalg.norm(query)
+        assert results[1][2] == pytest.approx(expected, rel=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_score_zero(self, engine, server_tools):
+        """Test that zero embeddings get a similarity of 0 instead of NaN."""
+        await engine.index_tools(server_tools)
+
+        results = engine.search("forecast query", top_k=10)
+
+        assert len(results) == 4
+        assert results[-1][0].name == "empty"
+        assert results[-1][2] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_embedding_matrix_reused_until_reindex(self, engine, server_tools):
+        """Test that the normalized embedding matrix is built once per index."""
+        await engine.index_tools(server_tools)
+        engine.search("forecast query", top_k=2)
+        matrix = engine._embedding_matrix
+
+        engine.query_cache.clear()
+        engine.search("forecast query", top_k=2)
+        assert engine._embedding_matrix is matrix
+        assert np.allclose(np.linalg.norm(matrix[:3], axis=1), 1.0)
+
+        await engine.index_tools(server_tools)
+        assert engine._embedding_matrix is None
+
+
+class TestToolSearchEngineIndexing:
+    """Test reuse of embeddings when re-indexing."""
+
+    @pytest.mark.asyncio
+    async def test_reindex_only_embeds_new_or_changed_tools(self, engine, server_tools):
+        """Test that unchanged tool texts are not sent to the embedding model again."""
+        await engine.index_tools(server_tools)
+        assert engine.embedding_function.call_count == 1
+
+        await engine.index_tools(server_tools)
+        assert engine.embedding_function.call_count == 1
+        assert engine.is_indexed
+
+        server_tools["server_b"][0] = make_tool("forecast", "Query")
+        await engine.index_tools(server_tools)
+        engine.embedding_function.assert_called_with(["forecast: query"])
+        assert set(engine.tool_embeddings) == {"weather", "github", "forecast", "empty"}
+
+
+class TestToolSearchEngineQueryCache:
+    """Test the bounded query result cache."""
+
+    @pytest.mark.asyncio
+    async def test_query_cache_evicts_least_recently_used(self, engine, server_tools, monkeypatch):
+        """Test that cached query results are bounded and evicted in LRU order."""
+        monkeypatch.setattr(ToolSearchEngine, "QUERY_CACHE_SIZE", 2)
+        await engine.index_tools(server_tools)
+
+        engine.search("forecast query", top_k=1)
+        engine.search("forecast query", top_k=2)
+        engine.search("forecast query", top_k=1)  # cache hit, becomes most recent
+        engine.search("forecast query", top_k=3)
+
+        assert list(engine.query_cache) == ["semantic:forecast query:1", "semantic:forecast query:3"]